@@ -7,15 +7,13 @@ import os
 import sys
 import shutil 
 
-sys.path.insert(0, os.path.abspath('..'))
-sys.path.insert(0, os.path.abspath('../src'))
-sys.path.insert(0, os.path.abspath('../src/main'))
+# Guard the inserts so repeated runs in one process (e.g. sphinx-autobuild) don't grow sys.path.
+for path in ('..', '../src', '../src/main'):
+    path = os.path.abspath(path)
+    if path not in sys.path:
+        sys.path.insert(0, path)
 
 
-# Check that pdflatex is downloaded so pdf builds will work.
-if not shutil.which("pdflatex"):
-    print("⚠️  Warning: pdflatex not found. PDF builds will fail.")
-
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
@@ -32,12 +30,31 @@ extensions = [
     'sphinx.ext.napoleon'
 ]
 
+# Set FAST_DOCS=1 for quick incremental builds; viewcode re-reads every source file.
+if os.environ.get('FAST_DOCS'):
+    extensions.remove('sphinx.ext.viewcode')
+
 templates_path = ['_templates']
 exclude_patterns = []
+keep_warnings = False
+nitpicky = False
 
 
 # -- Options for HTML output -------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#options-for-html-output
 
 html_theme = 'sphinx_rtd_theme'
-html_static_path = ['_static']
\ No newline at end of file
+html_static_path = ['_static']
+html_copy_source = False
+
+
+# -- Setup -------------------------------------------------------------------
+
+def check_pdflatex(app):
+    """Check that pdflatex is downloaded so pdf builds will work (LaTeX builders only)."""
+    if app.builder.name.startswith('latex') and not shutil.which("pdflatex"):
+        print("⚠️  Warning: pdflatex not found. PDF builds will fail.")
+
+
+def setup(app):
+    app.connect('builder-inited', check_pdflatex)
@@ -13,9 +13,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from typing import Optional
+from dataclasses import dataclass
+from typing import ClassVar, Optional
 
 
+@dataclass(slots=True, eq=False)
 class Arg:
     """A default argument or an argument for a specific validator definition (ex:
     required) can be stored to pass into a message as parameters. This can be used in a
@@ -39,104 +41,51 @@ class Arg:
         resource(bool): Whether or not the key is a message resource (optional). Defaults to True. If it is 'true', the value will try to be resolved as a message resource.
     """
 
-    serializable = True
+    serializable: ClassVar[bool] = True
     #: class is serializable
 
-    cloneable = True
+    cloneable: ClassVar[bool] = True
     #: class is cloneable
 
-    def __init__(self):
-        """Constructor for Arg, a default argument or an argument for a specific validator definition.
-        """
-        self._bundle: Optional[str] = None
-        #: The resource bundle name that this Arg's `key` should beresolved in (optional).
+    bundle: Optional[str] = None
+    #: The resource bundle name that this Arg's `key` should beresolved in (optional).
 
-        self._key: Optional[str] = None
-        #: The key or value of the argument.
+    key: Optional[str] = None
+    #: The key or value of the argument.
 
-        self._name: Optional[str] = None
-        #: The name dependency that this argument goes with (optional).
+    name: Optional[str] = None
+    #: The name dependency that this argument goes with (optional).
 
-        self._position: int = -1
-        #: This argument's position in the message. Set position=0 to make a replacement in this string: "some msg {0}". @since 1.1
+    position: int = -1
+    #: This argument's position in the message. Set position=0 to make a replacement in this string: "some msg {0}". @since 1.1
 
-        self._resource: bool = True
-        #: Whether or not the key is a message resource (optional). Defaults to True. If it is 'true', the value will try to be resolved as a message resource.
+    resource: bool = True
+    #: Whether or not the key is a message resource (optional). Defaults to True. If it is 'true', the value will try to be resolved as a message resource.
 
-    @property
-    def bundle(self) -> Optional[str]:
-        """
-        Get the resource bundle name.
+    def clone(self) -> "Arg":
+        """Creates and returns a copy of this Arg.
 
-        Returns: 
-            bundle (str)
-        """
-        return self._bundle
+        All of the fields are immutable (str, int, bool, or None), so they are
+        copied directly rather than through ``copy.deepcopy()``.
 
-    @bundle.setter
-    def bundle(self, value) -> None:
-        """Sets the resource bundle name."""
-        self._bundle = value
-
-    @property
-    def key(self) -> Optional[str]:
-        """
-        Gets the key/value.
-        
         Returns:
-            key (str)
+            A copy of the Arg.
         """
-        return self._key
-
-    @key.setter
-    def key(self, value) -> None:
-        """Sets the key/value."""
-        self._key = value
-
-    @property
-    def name(self) -> Optional[str]:
-        """
-        Gets the name of the dependency.
-        
-        Returns: 
-            name (str)
-        """
-        return self._name
-
-    @name.setter
-    def name(self, value) -> None:
-        """Sets the name of the dependency."""
-        self._name = value
-
-    @property
-    def position(self) -> int:
-        """
-        Gets the replacement position.
-        
-        Returns: 
-            position (int)
-        """
-        return self._position
-
-    @position.setter
-    def position(self, value) -> None:
-        """Sets the replacement position."""
-        self._position = value
-
-    @property
-    def resource(self) -> bool:
-        """
-        Tests whether or not the key is a resource key or literal value.
-        
-        Returns:
-            resource (bool)
-        """
-        return self._resource
-
-    @resource.setter
-    def resource(self, value) -> None:
-        """Sets whether or not the key is a resource."""
-        self._resource = value
+        arg = type(self).__new__(type(self))
+        arg.bundle = self.bundle
+        arg.key = self.key
+        arg.name = self.name
+        arg.position = self.position
+        arg.resource = self.resource
+        return arg
+
+    def __copy__(self) -> "Arg":
+        """Supports ``copy.copy()``; see `clone()`."""
+        return self.clone()
+
+    def __deepcopy__(self, memo: dict) -> "Arg":
+        """Supports ``copy.deepcopy()``; see `clone()`."""
+        return self.clone()
 
     def __str__(self):
-        return f"Arg: name={self._name}  key={self._key}  position={self._position}  bundle={self._bundle}  resource={self._resource}\n"
\ No newline at end of file
+        return f"Arg: name={self.name}  key={self.key}  position={self.position}  bundle={self.bundle}  resource={self.resource}\n"
@@ -13,7 +13,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from collections import OrderedDict  # If strict order is required
 from typing import List, Dict, Optional
 
 class Form:
@@ -30,14 +29,16 @@ class Form:
     cloneable = False
     #: This class is not cloneable.
 
+    __slots__ = ('name', '_l_fields', '_h_fields', '_inherit', '_processed')
+
     def __init__(self):
-        self._name: str = None
+        self.name: str = None
         #: The name/key that the set of validation rules is stored under.
 
         self._l_fields: List["Field"] = []  # List of Field objects
         #: List of `Field`s. Used to maintain the order they were added in. Individual `Field`s can be retrieved using _h_fields
 
-        self._h_fields: Dict[str, "Field"] = OrderedDict()
+        self._h_fields: Dict[str, "Field"] = {}
         #: Dict of `Field`s keyed on their property value. Use get_field_map() to access.
 
         self._inherit: str = None
@@ -100,15 +101,6 @@ class Form:
         # TODO make sure the original map won't be modified
         return self._l_fields.copy()
 
-    @property
-    def name(self) -> str:
-        """Gets the name of the form.
-
-        Returns:
-            The name of the form.
-        """
-        return self._name
-
     def is_extending(self) -> bool:
         """Gets extends flag."""
         return self._inherit is not None
@@ -133,21 +125,26 @@ class Form:
             depends (Form): the form we want to merge
         """
         temp_l_fields = []
-        temp_h_fields = OrderedDict()
+        temp_h_fields = {}
+        # ids of this form's fields that move to the front; dropped from `_l_fields` in one pass.
+        moved_ids = set()
+        field_map = self.get_field_map()
         for default_field in depends.fields:
             if default_field is not None:
                 field_key = default_field.key
-                if not self.contains_field(field_key):
+                if field_key not in field_map:
                     temp_l_fields.append(default_field)
                     temp_h_fields[field_key] = default_field
                 else:
-                    old = self.get_field(field_key)
-                    self.get_field_map().pop(field_key, None)
-                    self._l_fields.remove(old)
+                    old = field_map.pop(field_key)
+                    moved_ids.add(id(old))
                     temp_l_fields.append(old)
                     temp_h_fields[field_key] = old
-        self._l_fields = temp_l_fields + self._l_fields
-        self.get_field_map().update(temp_h_fields)
+        if moved_ids:
+            self._l_fields = temp_l_fields + [field for field in self._l_fields if id(field) not in moved_ids]
+        else:
+            self._l_fields = temp_l_fields + self._l_fields
+        field_map.update(temp_h_fields)
 
     def _process(
         self, global_constants: dict, constants: dict, forms: Dict[str, "Form"]
@@ -168,11 +165,17 @@ class Form:
             if parent:
                 if not parent.processed:
                     parent._process(constants, global_constants, forms)
-                for f in parent.fields:
-                    if f.key not in self.get_field_map():
-                        self._l_fields.insert(n, f)
-                        self.get_field_map()[f.key] = f
-                        n += 1
+                field_map = self.get_field_map()
+                inherited = []
+                # Read the parent's list directly; `fields` would copy it.
+                for f in parent._l_fields:
+                    key = f.key
+                    if key not in field_map:
+                        inherited.append(f)
+                        field_map[key] = f
+                # Inherited fields go first, in the parent's order.
+                self._l_fields[0:0] = inherited
+                n = len(inherited)
         for field in self._l_fields[n:]:
             field.process(global_constants, constants)
 
@@ -186,21 +189,14 @@ class Form:
         """
         self._inherit = inherit
 
-    @name.setter
-    def name(self, value: str) -> None:
-        """Sets the name of the form.
-
-        Args:
-            value: The name of the form to be set.
-        """
-        self._name = value
+    # The <form> xml element's `extends` attribute is set by name.
+    extends = property(get_extends, set_extends)
 
     def __str__(self) -> str:
         """Returns a string representation of the object."""
-        results = f"Form: {self._name}\n"
-        for field in self._l_fields:
-            results += f"\tField: {field}\n"
-        return results
+        results = [f"Form: {self.name}\n"]
+        results.extend(f"\tField: {field}\n" for field in self._l_fields)
+        return "".join(results)
 
     def validate(
         self, params: dict, actions: dict, page: int, field_name: str = None
@@ -240,15 +236,18 @@ class Form:
             field = self.get_field(field_name)
             if not field:
                 raise ValidatorException(
-                    f"Unknown field {field_name} in form {self._name}"
+                    f"Unknown field {field_name} in form {self.name}"
                 )
             params[Validator.FIELD_PARAM] = field
             if field.page <= page:
                 results.merge(field.validate(params, actions))
         else:
+            # A field's page can change after it was added, so the fields on the page aren't cached.
+            field_param = Validator.FIELD_PARAM
+            merge = results.merge
             for field in self._l_fields:
-                params[Validator.FIELD_PARAM] = field
+                params[field_param] = field
                 if field.page <= page:
-                    results.merge(field.validate(params, actions))
+                    merge(field.validate(params, actions))
 
         return results
\ No newline at end of file
@@ -14,6 +14,7 @@ limitations under the License.
 """
 
 import logging
+import sys
 from typing import Dict, Optional, Final
 
 class FormSet:
@@ -53,6 +54,11 @@ class FormSet:
     cloneable = False
     #: Class is not cloneable
 
+    __slots__ = (
+        'language', 'country', 'variant',
+        '__log', '__processed', '__forms', '__constants', '__merged', '__type_key', '__type'
+    )
+
     def __init__(self):
         """Initializes a new FormSet instance with default values."""
         self.__log: Optional[logging.Logger] = None
@@ -61,13 +67,13 @@ class FormSet:
         self.__processed: bool = False
         #: Indicates if the FormSet has been processed
 
-        self.__language: Optional[str] = None
+        self.language: Optional[str] = None
         #: Language component
 
-        self.__country: Optional[str] = None
+        self.country: Optional[str] = None
         #: Country component
 
-        self.__variant: Optional[str] = None
+        self.variant: Optional[str] = None
         #: Variant component
 
         self.__forms: Final[Dict[str, "Form"]] = {}
@@ -79,6 +85,12 @@ class FormSet:
         self.__merged: bool = False
         #: Flag indicating if FormSet has been merged
 
+        self.__type_key: Optional[tuple] = None
+        #: The (language, country, variant) that `__type` was computed for
+
+        self.__type: Optional[int] = None
+        #: Cached result of `_get_type()`
+
     def add_constant(self, name: str, value: str) -> None:
         """Adds a Constant to the FormSet.
 
@@ -101,6 +113,9 @@ class FormSet:
             f (Form): The Form to be added.
         """
         form_name = f.name
+        if type(form_name) is str:
+            # Interned so lookups by an interned form key match on identity.
+            form_name = sys.intern(form_name)
         if form_name in self.__forms:
             self._get_log().error(
                 "Form %s already exists in FormSet - ignoring.", form_name
@@ -126,12 +141,6 @@ class FormSet:
             results.append("default")
         return ", ".join(results)
 
-    @property
-    def country(self) -> Optional[str]:
-        """Returns the country component of the Locale."""
-        return self.__country
-    
-
     def get_form(self, form_name: str) -> Optional["Form"]:
         """Retrieves a Form from the FormSet by its name.
 
@@ -152,12 +161,6 @@ class FormSet:
         # TODO make this unmodifiable
         return self.__forms
 
-    @property
-    def language(self) -> Optional[str]:
-        """Returns the language component of the Locale."""
-        return self.__language
-
-
     def _get_log(self) -> logging.Logger:
         """Returns the logger for logging errors. Initializes the logger if necessary.
 
@@ -174,6 +177,15 @@ class FormSet:
         Returns:
             int: The FormSet type (GLOBAL_FORMSET, LANGUAGE_FORMSET, COUNTRY_FORMSET, VARIANT_FORMSET).
         """
+        type_key = (self.language, self.country, self.variant)
+        if type_key != self.__type_key:
+            # The Locale components changed since the type was last computed.
+            self.__type = self.__compute_type()
+            self.__type_key = type_key
+        return self.__type
+
+    def __compute_type(self) -> int:
+        """Computes the type of the FormSet, raising `ValueError` for invalid Locale components."""
         if self.variant:
             if not self.language or not self.country:
                 raise ValueError(
@@ -190,11 +202,6 @@ class FormSet:
             return self._LANGUAGE_FORMSET
         return self._GLOBAL_FORMSET
     
-    @property
-    def variant(self) -> Optional[str]:
-        """Returns the variant component of the Locale."""
-        return self.__variant
-    
     @property
     def merged(self) -> bool:
         """Returns whether the FormSet has been merged."""
@@ -228,34 +235,12 @@ class FormSet:
         Args:
             global_constants (Dict[str, str]): Global constants to be used during processing.
         """
-        for f in self.__forms.values():
-            f._process(global_constants, self.__constants, self.__forms)
+        constants = self.__constants
+        forms = self.__forms
+        for f in forms.values():
+            f._process(global_constants, constants, forms)
         self.__processed = True
 
-    @country.setter
-    def country(self, value: Optional[str]) -> None:
-        """Sets the country component of the Locale.
-
-        (translation of setCountry())
-        """
-        self.__country = value
-
-    @language.setter
-    def language(self, value: Optional[str]) -> None:
-        """Sets the language component of the Locale.
-
-        (translation of setLanguage())
-        """
-        self.__language = value
-
-    @variant.setter
-    def variant(self, value: Optional[str]) -> None:
-        """Sets the variant component of the Locale.
-
-        (translation of setVariant()
-        """
-        self.__variant = value
-
     def __str__(self) -> str:
         """Returns a string representation of the FormSet.
 
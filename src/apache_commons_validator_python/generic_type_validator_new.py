@@ -15,11 +15,32 @@ limitations under the License.
 
 import logging
 from typing import Final, Optional
-from ..generic_validator_new import GenericValidator
+from .generic_validator_new import GenericValidator
+from .routines.credit_card_validator import CreditCardValidator
 from datetime import datetime
-import locale
+import locale as py_locale
 import numpy as np
 
+# Validates the default card types (AMEX, VISA, MASTERCARD, DISCOVER) for `format_credit_card()`.
+_CREDIT_CARD_VALIDATOR: Final[CreditCardValidator] = CreditCardValidator()
+
+
+def _may_be_int(value: object) -> bool:
+    """Cheaply rule out strings that ``int()`` would reject, so invalid input doesn't pay
+    for raising and catching a `ValueError`.
+
+    Returns:
+        False if `value` is a string that can't be an integer literal; True if it may be one,
+        or isn't a string (which is left to the conversion to judge).
+    """
+    if not isinstance(value, str):
+        return True
+    digits = value.strip()
+    if digits[:1] in ("+", "-"):
+        digits = digits[1:]
+    # int() also accepts underscores between digits; leave those to int() to judge.
+    return digits.isdecimal() or ("_" in digits)
+
 
 class GenericTypeValidator:
     """GenericTypeValidator class provides methods to format and validate different
@@ -42,7 +63,7 @@ class GenericTypeValidator:
 
         Returns: the converted integer (byte) value
         """
-        if value is None:
+        if value is None or not _may_be_int(value):
             return None
         try:
             return np.int8(value)
@@ -67,15 +88,12 @@ class GenericTypeValidator:
 
         try:
             # Set the locale if provided, otherwise use the default locale
-            if locale:
-                locale.setlocale(locale.LC_ALL, locale)
-            else:
-                locale.setlocale(locale.LC_ALL, "")  # Use default locale
+            py_locale.setlocale(py_locale.LC_ALL, locale or "")
 
             # Attempt to convert the value to np.int8 (byte type in NumPy)
             return np.int8(value)
 
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, py_locale.Error):
             # Return None if parsing fails or locale error occurs
             return None
 
@@ -89,9 +107,9 @@ class GenericTypeValidator:
 
         Returns: the converted Credit Card number
         """
-        if GenericValidator.is_credit_card(value):
-            return int(value)
-        return None
+        # validate() checks the card and returns it in one pass.
+        card = _CREDIT_CARD_VALIDATOR.validate(value)
+        return None if card is None else int(card)
 
     @staticmethod
     # Method to convert a string value to a datetime object (date) using the system's locale
@@ -112,16 +130,15 @@ class GenericTypeValidator:
 
         try:
             if locale:
-                locale.setlocale(locale.LC_ALL, locale)
+                py_locale.setlocale(py_locale.LC_ALL, locale)
 
             return datetime.strptime(
                 value, "%x"
             )  # Try to convert the value to a datetime object
-        except ValueError:
-            if GenericTypeValidator._logger.isEnabledFor(logging.DEBUG):
-                GenericTypeValidator._logger.debug(
-                    f"Date parse failed value=[{value}], locale=[{locale}]"
-                )
+        except (ValueError, py_locale.Error):
+            GenericTypeValidator._logger.debug(
+                "Date parse failed value=[%s], locale=[%s]", value, locale
+            )
             return None
 
     @staticmethod
@@ -147,10 +164,9 @@ class GenericTypeValidator:
                 return None
             return date
         except ValueError:
-            if GenericTypeValidator._logger.isEnabledFor(logging.DEBUG):
-                GenericTypeValidator._logger.debug(
-                    f"Date parse failed value=[{value}], pattern=[{date_pattern}], strict=[{strict}]"
-                )
+            GenericTypeValidator._logger.debug(
+                "Date parse failed value=[%s], pattern=[%s], strict=[%s]", value, date_pattern, strict
+            )
             return None
 
     @staticmethod
@@ -184,14 +200,11 @@ class GenericTypeValidator:
 
         try:
             # Set the locale if provided, otherwise use the default locale
-            if locale:
-                locale.setlocale(locale.LC_ALL, locale)
-            else:
-                locale.setlocale(locale.LC_ALL, "")  # Use default locale
+            py_locale.setlocale(py_locale.LC_ALL, locale or "")
 
             return float(value)
 
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, py_locale.Error):
             # Return None if parsing fails
             return None
         
@@ -228,9 +241,9 @@ class GenericTypeValidator:
 
         try:
             if locale:
-                locale.setlocale(locale.LC_ALL, locale)
+                py_locale.setlocale(py_locale.LC_ALL, locale)
             return float(value)
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, py_locale.Error):
             return None
 
     @staticmethod
@@ -242,7 +255,7 @@ class GenericTypeValidator:
 
         Returns: the converted int value
         """
-        if value is None:
+        if value is None or not _may_be_int(value):
             return None
         try:
             return int(value)
@@ -262,18 +275,15 @@ class GenericTypeValidator:
 
         try:
             # Set the locale if provided, otherwise use the default locale
-            if locale:
-                locale.setlocale(locale.LC_ALL, locale)
-            else:
-                locale.setlocale(locale.LC_ALL, "")  # Use default locale
+            py_locale.setlocale(py_locale.LC_ALL, locale or "")
 
             # Attempt to parse the value as a number
-            parsed_value = locale.atoi(value)  # Convert the string to an integer
+            parsed_value = py_locale.atoi(value)  # Convert the string to an integer
 
             # Return the parsed value as np.int32 (standard integer type in NumPy)
             return np.int32(parsed_value)
 
-        except (ValueError, locale.Error):
+        except (ValueError, py_locale.Error):
             # Return None if parsing fails or locale error occurs
             return None
 
@@ -304,18 +314,15 @@ class GenericTypeValidator:
 
         try:
             # Set the locale if provided, otherwise use the default locale
-            if locale:
-                locale.setlocale(locale.LC_ALL, locale)
-            else:
-                locale.setlocale(locale.LC_ALL, "")  # Use default locale
+            py_locale.setlocale(py_locale.LC_ALL, locale or "")
 
             # Attempt to parse the value as a long integer (64-bit)
-            parsed_value = locale.atoi(value)  # Convert the string to an integer
+            parsed_value = py_locale.atoi(value)  # Convert the string to an integer
 
             # Return the parsed value as np.int64 (64-bit integer type in NumPy)
             return np.int64(parsed_value)
 
-        except (ValueError, locale.Error):
+        except (ValueError, py_locale.Error):
             # Return None if parsing fails or locale error occurs
             return None
         
@@ -346,18 +353,15 @@ class GenericTypeValidator:
 
         try:
             # Set the locale if provided, otherwise use the default locale
-            if locale:
-                locale.setlocale(locale.LC_ALL, locale)
-            else:
-                locale.setlocale(locale.LC_ALL, "")  # Use default locale
+            py_locale.setlocale(py_locale.LC_ALL, locale or "")
 
             # Attempt to parse the value as a short integer (16-bit)
-            parsed_value = locale.atoi(value)  # Convert the string to an integer
+            parsed_value = py_locale.atoi(value)  # Convert the string to an integer
 
             # Return the parsed value as np.int16 (16-bit integer type in NumPy)
             return np.int16(parsed_value)
 
-        except (ValueError, locale.Error):
+        except (ValueError, py_locale.Error):
             # Return None if parsing fails or locale error occurs
             return None
 
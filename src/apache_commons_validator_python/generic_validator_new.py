@@ -28,7 +28,8 @@ class GenericValidator:
     def is_blank_or_null(value: str) -> bool:
         """Checks if the field isn't null and the length of the field is greater than
         zero, not including whitespace."""
-        return value is None or value.strip() == ""
+        # isspace() scans in place (no stripped copy) and is False for an empty string.
+        return value is None or not value or value.isspace()
 
 
     def __init__(self):
@@ -14,9 +14,10 @@ limitations under the License.
 """
 
 import logging
-from typing import Final, Optional
-import pickle
+from dataclasses import dataclass
+from typing import ClassVar, Optional
 
+@dataclass(slots=True, eq=False)
 class Msg:
     """The Msg class represents a message that can be associated with a `Field` and a
     pluggable validator.
@@ -26,105 +27,42 @@ class Msg:
     in the `ValidatorAction`. Instances are configured with a <msg> XML element.
     """
 
-    serializable: Final[bool] = True  # Indicates if the object can be serialized
-    cloneable: Final[bool] = True  # Indicates if the object can be cloned
-    _logger = logging.getLogger(__name__)  # Logger for the Msg class
+    serializable: ClassVar[bool] = True  # Indicates if the object can be serialized
+    cloneable: ClassVar[bool] = True  # Indicates if the object can be cloned
+    _logger: ClassVar[logging.Logger] = logging.getLogger(__name__)  # Logger for the Msg class
 
-    def __init__(self):
-        self._bundle: Optional[str] = None #: # Resource bundle name for localization (optional)
-        self._key: Optional[str] = None  #: Key for the message (optional)
-        self._name: Optional[str] = None  #: Dependency name (optional)
-        self._resource: bool = True  #: Whether the key is a resource (default is True)
+    bundle: Optional[str] = None #: Resource bundle name for localization (optional)
+    key: Optional[str] = None  #: Key for the message (optional)
+    name: Optional[str] = None  #: Dependency name (optional)
+    resource: bool = True  #: Whether the key is a resource or a literal value (default is True)
 
     def clone(self) -> "Msg":
-        """Creates and returns a deep copy of the current Msg instance using
-        serialization. This method utilizes `pickle` to serialize and deserialize the
-        object.
+        """Creates and returns a copy of the current Msg instance.
 
-        # TODO: technically this should be overriding __copy__ and __deepcopy__
+        All of the fields are immutable (str, bool, or None), so copying them
+        directly gives an independent copy without a serialization round-trip.
         """
-        try:
-            return pickle.loads(
-                pickle.dumps(self)
-            )  # Serialize and deserialize to create a clone
-        except Exception as e:
-            # Raises an exception if cloning is not supported or fails
-            raise UnsupportedOperationException(f"Clone not supported: {e}")
+        msg = type(self).__new__(type(self))
+        msg.bundle = self.bundle
+        msg.key = self.key
+        msg.name = self.name
+        msg.resource = self.resource
+        return msg
 
-    @property
-    def bundle(self) -> Optional[str]:
-        """Gets the resource bundle name.
-        (translatin of getBundle())
+    def __copy__(self) -> "Msg":
+        """Supports ``copy.copy()``; see `clone()`."""
+        return self.clone()
 
-        Returns:
-            bundle (str)
-        """
-        return self._bundle
-
-    @property
-    def key(self) -> Optional[str]:
-        """Gets the key value.
-        (translation of getKey())
-
-        Returns:
-            key (str)
-        """
-        return self._key
-    
-    @property
-    def name(self) -> Optional[str]:
-        """Gets the dependency name.
-        (translation of getName())
-
-        Returns: 
-            name (str)
-        """
-        return self._name
-
-    @property
-    def resource(self) -> bool:
-        """Tests whether the key is a resource key or a literal value.
-        (translation of isResource())
-
-        Returns:
-            resource (bool)
-        """
-        return self._resource
-    
-    @bundle.setter
-    def bundle(self, bundle: Optional[str]) -> None:
-        """Sets the resource bundle name.
-        (translation of setBundle())
-        """
-        self._bundle = bundle
-
-    @key.setter
-    def key(self, key: Optional[str]) -> None:
-        """Sets the key value.
-        (translation of setKey())
-        """
-        self._key = key
-
-    @name.setter
-    def name(self, name: Optional[str]) -> None:
-        """Sets the dependency name.
-        (translation of setName())
-        """
-        self._name = name
-
-    @resource.setter
-    def resource(self, resource: bool) -> None:
-        """Sets whether the key is a resource.
-        (translation of setResource())
-        """
-        self._resource = resource
+    def __deepcopy__(self, memo: dict) -> "Msg":
+        """Supports ``copy.deepcopy()``; see `clone()`."""
+        return self.clone()
 
     def __str__(self) -> str:
         """Returns a string representation of the Msg instance showing its key
         properties. This helps with debugging and logging.
         (translation of toString())
         """
-        return f"Msg: name={self._name}  key={self._key}  resource={self._resource}  bundle={self._bundle}\n"
+        return f"Msg: name={self.name}  key={self.key}  resource={self.resource}  bundle={self.bundle}\n"
 
 class UnsupportedOperationException(Exception):
     """Custom exception raised when an unsupported operation is attempted."""
@@ -28,13 +28,16 @@ Changes:
         (e.g. `Calendar.MILLISECOND` -> datetime.millisecond`)
     - Modified compare() signature to accept string field names instead of integers for consistency with Python's datetime module.
     - Seperated `parse()` into helper functions to handle `date`, `time`, and `datetime` strings independently.
-    - Added helper function, `get_format_no_pattern()` to avoid overloading the `_get_format()` when no pattern is passed in (simpler logic).
+    - Added module-level helper function, `_build_formatter()`, which builds (and memoizes) the formatter returned by `_get_format()`.
 """
-from babel import Locale
+from babel import Locale as BabelLocale
 from babel.dates import format_datetime, format_time, format_date
 from datetime import datetime, timezone, tzinfo, date
 from dateparser import parse
-from typing import Union, Optional, Callable
+from functools import lru_cache
+from operator import attrgetter
+import re
+from typing import Iterable, Union, Optional, Callable
 
 from ..util.datetime_helpers import (
     get_default_tzinfo, 
@@ -55,6 +58,154 @@ from ..util.locale import Locale
 from ..generic_validator_new import GenericValidator
 from ..routines.abstract_format_validator import AbstractFormatValidator
 
+# Maps the integer date and time style to a string argument for `babel.format()`.
+_INT2STR_STYLE = {
+    0:'full',
+    1:'long',
+    2:'medium',
+    3:'short'
+}
+
+
+# Getters for the datetime fields `_compare()` and `_compare_time()` walk through.
+_TIME_FIELDS = ("hour", "minute", "second", "microsecond")
+_FIELD_GETTERS = {
+    name:attrgetter(name) for name in ("year", "month", "day") + _TIME_FIELDS
+}
+# For each field, the getters `_compare_time()` walks, in order, stopping at the first difference.
+_TIME_COMPARE_ORDER = {
+    name:tuple(_FIELD_GETTERS[f] for f in _TIME_FIELDS[:i + 1]) for i, name in enumerate(_TIME_FIELDS)
+}
+# For each field, the getters `_compare()` walks: year, month, day, and the time fields down to it.
+_DATE_GETTERS = (_FIELD_GETTERS["year"], _FIELD_GETTERS["month"], _FIELD_GETTERS["day"])
+_COMPARE_ORDER = {
+    "year":_DATE_GETTERS[:1],
+    "month":_DATE_GETTERS[:2],
+    "day":_DATE_GETTERS,
+    **{name:_DATE_GETTERS + getters for name, getters in _TIME_COMPARE_ORDER.items()},
+}
+# The getters walked after the field itself when it isn't one of the above, before raising.
+_UNKNOWN_FIELD_ORDER = (_FIELD_GETTERS["month"], _FIELD_GETTERS["day"]) + _TIME_COMPARE_ORDER["second"]
+
+
+@lru_cache(maxsize=32)
+def _normalize_field(field:str) -> Optional[str]:
+    """Memoized `to_lower()` for compare field names; the vocabulary is tiny."""
+    return to_lower(field)
+
+
+# %Z matches a zone name (e.g. 'UTC'), but strptime() returns a naive datetime for it, dropping the zone.
+_ZONE_NAME_DIRECTIVE_RE = re.compile(r"%Z")
+# strptime directives whose text depends on the locale (day/month names, AM/PM), plus %Z.
+_LOCALE_DIRECTIVE_RE = re.compile(r"%[aAbBpZ]")
+
+
+@lru_cache(maxsize=128)
+def _strptime_format(pattern:str) -> Optional[str]:
+    """
+    Memoized strptime format for an LDML `pattern`, or None if strptime would drop its parsed zone.
+    """
+    strptime_format = ldml_to_strptime_format(pattern)
+    return None if _ZONE_NAME_DIRECTIVE_RE.search(strptime_format) else strptime_format
+
+
+@lru_cache(maxsize=128)
+def _locale_free_strptime_format(pattern:str) -> Optional[str]:
+    """
+    Memoized strptime format for an LDML `pattern`, or None if parsing it would depend on the locale
+    or drop its parsed zone.
+    """
+    strptime_format = ldml_to_strptime_format(pattern)
+    return None if _LOCALE_DIRECTIVE_RE.search(strptime_format) else strptime_format
+
+
+def _strptime_fast_path(value:str, pattern:str, time_zone:Optional[tzinfo], locale_free:bool) -> Optional[datetime]:
+    """
+    Parses `value` against the LDML `pattern` with ``datetime.strptime()``, in `time_zone`.
+    Naive results are placed in `time_zone`; results with a parsed UTC offset are converted to it.
+
+    This is a fast path to try before ``dateparser``; a None result means the caller should fall back.
+    Patterns with a zone name ('z') are never tried, since strptime() can't convert from the zone.
+    If `locale_free` is True, only patterns whose parse doesn't depend on the locale are tried.
+    """
+    strptime_format = _locale_free_strptime_format(pattern) if locale_free else _strptime_format(pattern)
+    if strptime_format is None:
+        return None
+    try:
+        dt = datetime.strptime(value, strptime_format)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=time_zone)
+    # The pattern parsed a UTC offset (e.g. 'Z' or 'X'); keep the instant and convert.
+    return dt if time_zone is None else dt.astimezone(time_zone)
+
+
+def _matches_pattern(value:str, pattern:str) -> bool:
+    """
+    Returns True if `value` parses with ``datetime.strptime()`` against the LDML `pattern`.
+    False means the caller should fall back, including for patterns `_locale_free_strptime_format()` rejects.
+    """
+    strptime_format = _locale_free_strptime_format(pattern)
+    if strptime_format is None:
+        return False
+    try:
+        datetime.strptime(value, strptime_format)
+        return True
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=16)
+def _parse_settings(tz_name:str, set_timezone:bool) -> dict:
+    """
+    Memoized settings dict for ``dateparser``, returning datetimes aware in `tz_name`.
+    If `set_timezone` is True, naive input is also read as being in `tz_name`.
+
+    The dict is shared between calls, so callers must not modify it.
+    """
+    settings = {'RETURN_AS_TIMEZONE_AWARE': True, 'TO_TIMEZONE': tz_name}
+    if set_timezone:
+        settings['TIMEZONE'] = tz_name
+    return settings
+
+
+@lru_cache(maxsize=64)
+def _get_babel_locale(locale:Union[str, BabelLocale]) -> BabelLocale:
+    """Memoized ``babel.Locale.parse()``, so babel doesn't re-parse the locale code on every format call."""
+    return BabelLocale.parse(locale)
+
+
+@lru_cache(maxsize=256)
+def _build_formatter(date_style:int, time_style:int, pattern:Optional[str], locale:Union[str, Locale]) -> Callable:
+    """
+    Builds the formatting function for a date/time style, pattern, and locale.
+
+    Memoized, so repeated `format()` calls with the same arguments reuse one function.
+    See `AbstractCalendarValidator._get_format()`.
+    """
+    locale = _get_babel_locale(locale)
+    if not GenericValidator.is_blank_or_null(pattern):
+        # Use both locale AND pattern to format the datetime
+        return lambda dt:format_datetime(datetime=dt, format=pattern, locale=locale)
+
+    # No pattern given; purely dependent on locale.
+    # Get formatting styles for date and time
+    date_format_style = _INT2STR_STYLE.get(date_style, 'short')
+    time_format_style = _INT2STR_STYLE.get(time_style, 'short')
+
+    # Formatting a datetime
+    if date_style >= 0 and time_style >= 0:
+        # Create the datetime pattern of this class.
+        datetime_format_style = f"{date_format_style} {time_format_style}"
+        return lambda dt:format_datetime(dt, format = datetime_format_style, locale = locale)
+    # Formatting a time only
+    elif time_style >= 0:
+        return lambda dt:format_time(dt, format = time_format_style, locale = locale)
+    # Formatting a date only
+    else:
+        return lambda dt:format_date(dt, format = date_format_style, locale = locale)
+
 
 class AbstractCalendarValidator(AbstractFormatValidator):
     """
@@ -70,12 +221,7 @@ class AbstractCalendarValidator(AbstractFormatValidator):
         cloneable (bool): Indicates if the object can be cloned.
     """
     # Maps the integer date and time style to a string argument for `babel.format()`.
-    __int2str_style = {
-        0:'full',
-        1:'long',
-        2:'medium',
-        3:'short'
-    }
+    __int2str_style = _INT2STR_STYLE
     # Attributes to manage serialization and cloning capabilities
     serializable = True    # class is serializable
     cloneable = False      # class is not cloneable
@@ -92,23 +238,30 @@ class AbstractCalendarValidator(AbstractFormatValidator):
         super().__init__(strict)
         self.__date_style = date_style
         self.__time_style = time_style
+        # The babel style names for the date and time styles, resolved once.
+        self.__date_format_style = self.__int2str_style.get(date_style, 'short')
+        self.__time_format_style = self.__int2str_style.get(time_style, 'short')
     
 
-    def __calculate_compare_result(self, value:datetime, compare:datetime, field:str) -> int:
+    @staticmethod
+    def __compare_fields(value:datetime, compare:datetime, getters:tuple) -> int:
         """
-        Compare a specific datetime attribute between two datetimes.
+        Compare two datetimes field by field, stopping at the first field that differs.
 
         Args:
             value (datetime): First datetime.
             compare (datetime): Second datetime.
-            field (str): Name of the attribute to compare (e.g., "year", "month").
-                Space padding and case-insensitve.
+            getters (tuple): Getters of the fields to compare, in order.
 
         Returns:
-            int: 0 if equal, -1 if `value.<field>` < `compare.<field>`, 1 otherwise.
-
+            int: 0 if all fields are equal, otherwise -1 if `value` < `compare` at the first differing field, 1 if greater.
         """
-        return integer_compare(getattr(value, field), getattr(compare, field))
+        for get in getters:
+            a = get(value)
+            b = get(compare)
+            if a != b:
+                return 1 if a > b else -1
+        return 0
 
 
     def __calculate_quarter(self, calendar:datetime, month_of_first_quarter:int) ->int:
@@ -125,7 +278,7 @@ class AbstractCalendarValidator(AbstractFormatValidator):
         year = calendar.year
         month = calendar.month
         
-        if month > month_of_first_quarter:
+        if month >= month_of_first_quarter:
             relative_month = month - month_of_first_quarter
         else:
             relative_month = month + 12 - month_of_first_quarter
@@ -156,29 +309,21 @@ class AbstractCalendarValidator(AbstractFormatValidator):
             int: Comparison result: 0 if equal, -1 if `value` < `compare`, 1 if `value` > `compare`.
         """ 
         # process field
-        field = to_lower(field)
+        field = _normalize_field(field)
 
         # Cover edge case of weeks
         if field == "week":
             return self.compare_weeks(value, compare)
-            
-        # Compare Year
-        result = self.__calculate_compare_result(value, compare, field)
-        if result != 0 or field == "year":
-            return result
 
-        # Compare Month 
-        result = self.__calculate_compare_result(value, compare, "month")
-        if result != 0 or field == "month":
-            return result
+        getters = _COMPARE_ORDER.get(field)
+        if getters is not None:
+            return self.__compare_fields(value, compare, getters)
 
-        # Compare Day
-        result = self.__calculate_compare_result(value, compare, "day")
-        if result != 0 or field == "day":
+        # Not a datetime field; getattr() raises if it isn't an attribute at all.
+        result = self.__compare_fields(value, compare, (attrgetter(field),) + _UNKNOWN_FIELD_ORDER)
+        if result != 0:
             return result
-        
-        # Compare Time fields
-        return self._compare_time(value, compare, field)
+        raise ValueError(f"Invalid field: {field}")
     
 
     def _compare_quarters(self, value:datetime, compare:datetime, month_of_first_quarter:int) ->int:
@@ -195,7 +340,6 @@ class AbstractCalendarValidator(AbstractFormatValidator):
         """
         value_quarter = self.__calculate_quarter(value, month_of_first_quarter)
         compare_quarter = self.__calculate_quarter(compare, month_of_first_quarter)
-        print(f"Value: {value_quarter}, compare; {compare_quarter}")
         return integer_compare(value_quarter, compare_quarter)
 
 
@@ -216,27 +360,15 @@ class AbstractCalendarValidator(AbstractFormatValidator):
             ValueError: If `field` is not a valid time attribute.
         """
         # process field
-        field = to_lower(field)
-
-        # Compare Hour
-        result = self.__calculate_compare_result(value, compare, "hour")
-        if (result != 0 or field == "hour"):
-            return result
+        field = _normalize_field(field)
 
-        # Compare Minute
-        result = self.__calculate_compare_result(value, compare, "minute")
-        if (result != 0 or field == "minute"):
-            return result
+        getters = _TIME_COMPARE_ORDER.get(field)
+        if getters is not None:
+            return self.__compare_fields(value, compare, getters)
 
-        # Compare Second
-        result = self.__calculate_compare_result(value, compare, "second")
-        if (result != 0 or field == "second"):
+        result = self.__compare_fields(value, compare, _TIME_COMPARE_ORDER["second"])
+        if result != 0:
             return result
-
-        # Compare Microsecond
-        if field == "microsecond":
-            return self.__calculate_compare_result(value, compare, "microsecond")
-
         raise ValueError(f"Invalid field: {field}")
 
 
@@ -277,23 +409,13 @@ class AbstractCalendarValidator(AbstractFormatValidator):
         if value is None:
             return None
         # Decide the timezone:
-        # If the time_zone is not given, and the value is timezone-aware, use the tzinfo from the value
-        # If the time_zone is not given, and the value is timezone-naive, use the system default
-        # If the time_zone is given update the value tzinfo to match
-
-        # If the timezone is not given, use the value's timezone or the system default.
-        if time_zone is None:
-            if isinstance(value, datetime):
-                time_zone = value.tzinfo
+        # If the timezone is not given, the value is formatted as is.
+        # If the timezone is given (and isn't the value's tzinfo already), update the value's timezone to match.
+        if time_zone is not None and isinstance(value, datetime) and value.tzinfo is not time_zone:
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=time_zone)
             else:
-                time_zone = get_default_tzinfo()
-        # If the timezone is given, update the value's timezone to match.
-        else:
-            if isinstance(value, datetime):
-                if value.tzinfo is None:
-                    value = value.replace(tzinfo=time_zone)
-                else:
-                    value = value.astimezone(tz=time_zone)
+                value = value.astimezone(tz=time_zone)
        
         formatter = self._get_format(pattern=pattern, locale=locale)
         return self._format(value=value, formatter=formatter)
@@ -312,36 +434,13 @@ class AbstractCalendarValidator(AbstractFormatValidator):
         """
         if locale is None:
             locale = get_default_locale()
+        elif isinstance(locale, Locale):
+            locale = str(locale)
 
-       
-        def get_format_no_pattern(locale:Union[str, Locale]) -> Callable:
-            """
-            Called only when pattern is blank or None.
-            Returns: 
-                Callable: Function to format the datetime based on specified locale. 
-            """
-            # Get formatting styles for date and time
-            date_format_style = self.__int2str_style.get(self.__date_style, 'short')
-            time_format_style = self.__int2str_style.get(self.__time_style, 'short')
-            
-            # Formatting a datetime
-            if self.__date_style >= 0 and self.__time_style >= 0:
-                # Create the datetime pattern of this class.
-                datetime_format_style = f"{date_format_style} {time_format_style}"  
-                return lambda dt:format_datetime(dt, format = datetime_format_style, locale = locale) 
-            # Formatting a time only
-            elif self.__time_style >= 0:        
-                return lambda dt:format_time(dt, format = time_format_style, locale = locale)          
-            # Formatting a date only
-            else:
-                return lambda dt:format_date(dt, format = date_format_style, locale = locale)
-
-        if GenericValidator.is_blank_or_null(pattern):
-            # No pattern given; purely dependent on locale.
-            return get_format_no_pattern(locale)
-        else:
-            # Use both locale AND pattern to format the datetime
-            return lambda dt:format_datetime(datetime=dt, format=pattern, locale=locale)
+        if isinstance(locale, (str, BabelLocale)) and (pattern is None or isinstance(pattern, str)):
+            return _build_formatter(self.__date_style, self.__time_style, pattern, locale)
+        # Other argument types may be unhashable, so they aren't memoized.
+        return _build_formatter.__wrapped__(self.__date_style, self.__time_style, pattern, locale)
 
 
     def is_valid(self, *, value:str, pattern:Optional[str]=None, locale:Optional[str]=None) -> bool:
@@ -356,7 +455,31 @@ class AbstractCalendarValidator(AbstractFormatValidator):
         Returns:
             bool: True if parsable, False otherwise.
         """
+        # Fast path: a datetime string matching the exact pattern is valid, without building it in a
+        # timezone. Anything else still goes through `_parse()`, which may accept it more leniently.
+        if (locale is None and self.__date_style >= 0 and self.__time_style >= 0
+                and not GenericValidator.is_blank_or_null(value)
+                and not GenericValidator.is_blank_or_null(pattern)
+                and _matches_pattern(value, pattern)):
+            return True
         return (self._parse(value, pattern, locale, time_zone=None) is not None)
+
+
+    def is_valid_batch(self, values:Iterable[str], pattern:Optional[str]=None, locale:Optional[str]=None) -> list[bool]:
+        """
+        Validate a sequence of date, time, or datetime strings using the same pattern and locale
+        for every value.
+
+        Args:
+            values (Iterable[str]): The input strings to validate.
+            pattern (str): LDML pattern string. Uses locale defaults if None.
+            locale (str): Locale code (e.g., "en_US"). Uses system default if None.
+
+        Returns:
+            list[bool]: True for each parsable value and False otherwise, in the same order as `values`.
+        """
+        is_valid = self.is_valid
+        return [is_valid(value=value, pattern=pattern, locale=locale) for value in values]
  
 
     def _parse(self, value:str, pattern:Optional[str]=None, locale:Optional[str]=None, time_zone:Optional[tzinfo]=None) -> Optional[object]:
@@ -381,15 +504,14 @@ class AbstractCalendarValidator(AbstractFormatValidator):
         if GenericValidator.is_blank_or_null(value):
             return None
       
-        # Create the settings dict to call dateparser.parse() with,
+        # Get the settings dict to call dateparser.parse() with,
         # And set the time_zone to the system default if `None`.
-        settings = {'RETURN_AS_TIMEZONE_AWARE': True}
         if time_zone is None:
             time_zone = get_default_tzinfo()
+            settings = _parse_settings(get_tzname(time_zone), False)
         else:
             # If we are not using default, we need to tell dateparser parse to the passed in tzinfo
-            settings.update({'TIMEZONE' : get_tzname(time_zone)})
-        settings.update({'TO_TIMEZONE' : get_tzname(time_zone)})
+            settings = _parse_settings(get_tzname(time_zone), True)
         
         # Call the correct parser
         if self.__time_style >= 0 and self.__date_style >= 0:
@@ -414,6 +536,11 @@ class AbstractCalendarValidator(AbstractFormatValidator):
         """
         if GenericValidator.is_blank_or_null(pattern):
             pattern = ""
+        else:
+            # Try the exact pattern first; `dateparser` is a slow, lenient fallback.
+            dt = _strptime_fast_path(value, pattern, time_zone, locale_free=locale is not None)
+            if dt is not None:
+                return dt
         if locale is None:
             return parse(date_string=value, date_formats=[pattern], settings=settings)
         else:
@@ -429,10 +556,9 @@ class AbstractCalendarValidator(AbstractFormatValidator):
             try:
                 # No pattern, use locale only (which may or may not be the default).
                 if GenericValidator.is_blank_or_null(pattern):
-                    date_format = self.__int2str_style.get(self.__date_style, 'short')
                     dt = ldml2strpdate(
                         value=value, 
-                        style_format=date_format, 
+                        style_format=self.__date_format_style, 
                         locale=locale
                     )
                 # Pattern provided, no locale (use pattern only)
@@ -447,7 +573,12 @@ class AbstractCalendarValidator(AbstractFormatValidator):
             except Exception as e:
                 return None
 
-        # Parsing with locale and pattern (note, this is a last resort and not fully accurate).
+        # Parsing with locale and pattern: try the exact pattern first, if the locale doesn't affect it.
+        dt = _strptime_fast_path(value, pattern, time_zone, locale_free=True)
+        if dt is not None:
+            return dt
+
+        # Otherwise fall back to dateparser (note, this is a last resort and not fully accurate).
         return fuzzy_parse(value=value, pattern=pattern, locale=locale, settings=settings)
 
 
@@ -460,10 +591,9 @@ class AbstractCalendarValidator(AbstractFormatValidator):
         try:
             # No pattern providee; Use locale only (which may or may not be the default).
             if GenericValidator.is_blank_or_null(pattern):
-                time_format = self.__int2str_style.get(self.__time_style, 'short')
                 dt_time = ldml2strptime(
                     value=value,
-                    style_format=time_format,
+                    style_format=self.__time_format_style,
                     locale=locale
                 )
             # Pattern provided, No locale (use pattern only)
@@ -23,6 +23,7 @@ License (Taken from apache.commons.validator.routines.AbstractNumberValidator.ja
     limitations under the License.
 """
 
+from functools import lru_cache
 from typing import Final, override
 from babel.numbers import format_decimal, format_currency, get_territory_currencies
 from babel.core import Locale
@@ -32,6 +33,14 @@ from ..routines.abstract_format_validator import AbstractFormatValidator
 from ..generic_validator_new import GenericValidator
 from ..util.decimal_places import max_decimal_places
 
+# Letters stripped from a value before it is compared against its pattern match.
+_LETTERS_RE: Final[re.Pattern] = re.compile(r"[A-Za-z]")
+
+@lru_cache(maxsize=1024)
+def _compile(pattern: str) -> re.Pattern:
+    """Memoized `re.compile()` for the caller-supplied validation patterns."""
+    return re.compile(pattern)
+
 class AbstractNumberValidator(AbstractFormatValidator):
     """Abstract base class for Number Validation.
 
@@ -168,7 +177,7 @@ class AbstractNumberValidator(AbstractFormatValidator):
         Returns:
             `True` if the value is within the specified range.
         """
-        return min_val <= value and value <= max_val
+        return min_val <= value <= max_val
     
     @override
     def is_valid(self, value: str, pattern: str=None, locale: str=None):
@@ -221,10 +230,11 @@ class AbstractNumberValidator(AbstractFormatValidator):
         Returns:
             `True` if the value follows the specified pattern.
         """
-        if self.strict and not re.fullmatch(pattern, value):
+        regex = _compile(pattern)
+        if self.strict and not regex.fullmatch(value):
             return None
         
-        match = re.search(pattern, value)
+        match = regex.search(value)
         if not bool(match):
             return None
         try:
@@ -233,7 +243,7 @@ class AbstractNumberValidator(AbstractFormatValidator):
         except Exception:
             return None
         
-        value = re.sub(r"[A-Za-z]", '', value)
+        value = _LETTERS_RE.sub('', value)
         
         # check that partial match is valid
         decimal_point = locale.number_symbols.get('decimal')
@@ -27,11 +27,17 @@ License (Taken from apache.commons.validator.routines.CalendarValidator.java):
 """
 from __future__ import annotations            
 from datetime import datetime, date, time, tzinfo
-from typing import Optional, Callable
+import re
+from typing import Final, Optional, Callable
 
 from ..routines.abstract_calendar_validator import AbstractCalendarValidator
-from ..util.datetime_helpers import timezone_has_same_rules
-from ..util.validator_utils import integer_compare
+from ..util.datetime_helpers import get_default_tzinfo
+
+# Shared midnight time used to convert parsed dates into datetimes.
+_MIDNIGHT:Final[time] = time(0, 0, 0)
+# The ISO-8601 date pattern, and the exact shape of the strings it matches.
+_ISO_DATE_PATTERN:Final[str] = "yyyy-MM-dd"
+_ISO_DATE_REGEX:Final[re.Pattern] = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
 
 
 class CalendarValidator(AbstractCalendarValidator):
@@ -51,10 +57,9 @@ class CalendarValidator(AbstractCalendarValidator):
     # Attributes to manage serialization and cloning capabilities
     serializable = True    # Class extends AbstracCalendarvalidator which is serializable
     cloneable = False      # Class extends AbstracCalendarvalidator which is not cloneable
-    __VALIDATOR:CalendarValidator = None    # A singleton instance of this CalendarValidator.
 
 
-    def __init__(self, *, strict:bool = True, date_style:int=3):
+    def __init__(self, strict:bool = True, date_style:int=3):
         """Initializes the CalendarValidator with configurable parsing strictness and
         date style.
 
@@ -62,7 +67,7 @@ class CalendarValidator(AbstractCalendarValidator):
             strict (bool): If True, enforces strict format parsing. Defaults to True.
             date_style (int): The date style to use for locale validation. Defaults to 3 (short format).
         """
-        super().__init__(strict=strict, date_style=date_style, time_style=-1)
+        super().__init__(strict, date_style, -1)
 
 
     @classmethod
@@ -76,26 +81,15 @@ class CalendarValidator(AbstractCalendarValidator):
         Returns:
             datetime: A new datetime with the adjusted timezone.
         """
-        # Case 1: For a naive datetime, simply attach the new timezone.
-        if value.tzinfo is None:
-            return value.replace(tzinfo=time_zone)
-        
-        # Case 2: If current tzinfo has the same rules as new_tz,
-        # then simply reassign the tzinfo without converting the local time.
-        if timezone_has_same_rules(value.tzinfo, time_zone):
-            return value.replace(tzinfo=time_zone)
-        
-        # Case 3: Otherwise, extract the local fields and create a new datetime.
-        # This ensures that the local displayed time remains unchanged.
-        year = value.year
-        month = value.month
-        day = value.day
-        hour = value.hour
-        minute = value.minute
-        second = value.second
-        microsecond = value.microsecond
-        
-        return datetime(year, month, day, hour, minute, second, microsecond, tzinfo=time_zone)
+        # The datetime already uses this exact tzinfo; nothing to adjust.
+        if value.tzinfo is time_zone:
+            return value
+
+        # Otherwise, reassign the tzinfo without converting the local time.
+        # This covers naive datetimes, timezones with the same rules, and timezones with
+        # different rules alike: `replace()` keeps the local fields intact, so the local
+        # displayed time remains unchanged.
+        return value.replace(tzinfo=time_zone)
 
 
     @classmethod
@@ -105,9 +99,7 @@ class CalendarValidator(AbstractCalendarValidator):
         Returns:
             CalendarValidator: The singleton instance.
         """
-        if cls.__VALIDATOR == None:
-            cls.__VALIDATOR = cls()
-        return cls.__VALIDATOR
+        return _VALIDATOR
 
     def compare_dates(self, value:datetime, compare:datetime) -> int:
         """
@@ -120,7 +112,9 @@ class CalendarValidator(AbstractCalendarValidator):
         Returns:
             int: 0 if equal, -1 if value < compare, 1 if value > compare.
         """
-        return self._compare(value, compare, "day")
+        value_date = (value.year, value.month, value.day)
+        compare_date = (compare.year, compare.month, compare.day)
+        return (value_date > compare_date) - (value_date < compare_date)
 
 
     def compare_months(self, value:datetime, compare:datetime) -> int:
@@ -133,7 +127,9 @@ class CalendarValidator(AbstractCalendarValidator):
         Returns:
             int: 0 if equal, -1 if value < compare, 1 if value > compare.
         """
-        return self._compare(value, compare, "month")
+        value_month = (value.year, value.month)
+        compare_month = (compare.year, compare.month)
+        return (value_month > compare_month) - (value_month < compare_month)
 
     
     def compare_quarters(self, value:datetime, compare:datetime, month_of_first_quarter:int = 1) -> int:
@@ -147,7 +143,29 @@ class CalendarValidator(AbstractCalendarValidator):
         Returns:
             int: 0 if equal, -1 if value < compare, 1 if value > compare.
         """
-        return super()._compare_quarters(value=value, compare=compare, month_of_first_quarter=month_of_first_quarter)
+        value_quarter = self.quarter_key(value, month_of_first_quarter)
+        compare_quarter = self.quarter_key(compare, month_of_first_quarter)
+        return (value_quarter > compare_quarter) - (value_quarter < compare_quarter)
+
+
+    @staticmethod
+    def quarter_key(value:datetime, month_of_first_quarter:int = 1) -> tuple[int, int]:
+        """Computes a sortable (year, quarter) key for a datetime.
+
+        When repeatedly comparing against a fixed reference datetime, compute the
+        reference's key once and compare the keys directly.
+
+        Args:
+            value (datetime): The datetime to compute the quarter of.
+            month_of_first_quarter (int): The starting month of the first quarter. Defaults to 1 (January).
+
+        Returns:
+            tuple[int, int]: The (year, quarter) the datetime falls in, with quarters numbered 1-4.
+        """
+        month = value.month
+        quarter = (month - month_of_first_quarter) % 12 // 3 + 1
+        year = value.year - 1 if month < month_of_first_quarter else value.year
+        return (year, quarter)
 
 
     def compare_weeks(self, value:datetime, compare:datetime) -> int:
@@ -161,12 +179,13 @@ class CalendarValidator(AbstractCalendarValidator):
         Returns:
             int: 0 if equal, -1 if value < compare, 1 if value > compare.
         """
-        if self._compare(value, compare, "year") != 0:
-            return self._compare(value, compare, "year")
-    
-        value_week = value.isocalendar()[1]
-        compare_week = compare.isocalendar()[1]
-        return integer_compare(value_week, compare_week)
+        result = self.compare_years(value, compare)
+        if result != 0:
+            return result
+
+        value_week = value.isocalendar().week
+        compare_week = compare.isocalendar().week
+        return (value_week > compare_week) - (value_week < compare_week)
         
 
     def compare_years(self, value:datetime, compare:datetime) -> int:
@@ -179,7 +198,7 @@ class CalendarValidator(AbstractCalendarValidator):
         Returns:
             int: 0 if equal, -1 if value < compare, 1 if value > compare.
         """
-        return self._compare(value, compare, "year")
+        return (value.year > compare.year) - (value.year < compare.year)
 
 
     def _process_parsed_value(self, value:date, formatter:Callable) -> datetime:
@@ -193,13 +212,16 @@ class CalendarValidator(AbstractCalendarValidator):
         Returns:
             datetime: The combined datetime object with time set to 00:00:00.
         """
-        return datetime.combine(value, time())
+        return datetime.combine(value, _MIDNIGHT)
             
     
     def validate(self, value:str=None, pattern:str=None, locale:Optional[str]=None, time_zone:Optional[tzinfo]=None) -> datetime: 
         """
         Validates and converts a string to a datetime object.
 
+        Dispatches to the specialized ``validate_*()`` method matching the arguments given;
+        call those directly to skip the dispatch.
+
         Args:
             value (str, optional): The string to validate.
             pattern (str, optional): The pattern to use for parsing.
@@ -209,4 +231,97 @@ class CalendarValidator(AbstractCalendarValidator):
         Returns:
             datetime or None: The parsed datetime if valid, otherwise None.
         """
-        return self._parse(value, pattern, locale, time_zone)
\ No newline at end of file
+        if time_zone is not None:
+            return self.validate_full(value, pattern, locale, time_zone)
+        if pattern is None:
+            if locale is None:
+                return self.validate_default(value)
+            return self.validate_locale(value, locale)
+        if locale is None:
+            return self.validate_pattern(value, pattern)
+        return self.validate_full(value, pattern, locale)
+
+
+    def validate_default(self, value:str) -> Optional[datetime]:
+        """
+        Validates and converts a string to a datetime object using the default date style
+        of the system default locale, in the system default timezone.
+
+        Args:
+            value (str): The string to validate.
+
+        Returns:
+            datetime or None: The parsed datetime if valid, otherwise None.
+        """
+        return self._parse(value, None, None, None)
+
+
+    def validate_pattern(self, value:str, pattern:str) -> Optional[datetime]:
+        """
+        Validates and converts a string to a datetime object using a pattern,
+        in the system default timezone.
+
+        Args:
+            value (str): The string to validate.
+            pattern (str): The pattern to use for parsing.
+
+        Returns:
+            datetime or None: The parsed datetime if valid, otherwise None.
+        """
+        if pattern == _ISO_DATE_PATTERN:
+            return self.__parse_iso(value, None)
+        return self._parse(value, pattern, None, None)
+
+
+    def validate_locale(self, value:str, locale:str) -> Optional[datetime]:
+        """
+        Validates and converts a string to a datetime object using the default date style
+        of a locale, in the system default timezone.
+
+        Args:
+            value (str): The string to validate.
+            locale (str): The locale to use for parsing.
+
+        Returns:
+            datetime or None: The parsed datetime if valid, otherwise None.
+        """
+        return self._parse(value, None, locale, None)
+
+
+    def validate_full(self, value:str, pattern:Optional[str]=None, locale:Optional[str]=None, time_zone:Optional[tzinfo]=None) -> Optional[datetime]:
+        """
+        Validates and converts a string to a datetime object using any combination of
+        pattern, locale, and timezone.
+
+        Args:
+            value (str): The string to validate.
+            pattern (str, optional): The pattern to use for parsing.
+            locale (str, optional): The locale to use for parsing.
+            time_zone (tzinfo, optional): The timezone to apply.
+
+        Returns:
+            datetime or None: The parsed datetime if valid, otherwise None.
+        """
+        if pattern == _ISO_DATE_PATTERN and locale is None:
+            return self.__parse_iso(value, time_zone)
+        return self._parse(value, pattern, locale, time_zone)
+
+
+    def __parse_iso(self, value:str, time_zone:Optional[tzinfo]) -> Optional[datetime]:
+        """
+        Parses a string with the ISO-8601 date pattern, "yyyy-MM-dd".
+
+        Strings with the exact ISO shape are parsed by the C-implemented `fromisoformat()`;
+        anything else falls back to the general parser.
+        """
+        if value is None or not _ISO_DATE_REGEX.fullmatch(value):
+            return self._parse(value, _ISO_DATE_PATTERN, None, time_zone)
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        return dt.replace(tzinfo=get_default_tzinfo() if time_zone is None else time_zone)
+
+
+# A singleton instance of this CalendarValidator.
+_VALIDATOR:CalendarValidator = CalendarValidator()
@@ -41,11 +41,11 @@ License (Taken from apache.commons.validator.routines.checkdigit.CheckDigit.java
     limitations under the License.
 
 Changes:
-    Added serializeable and clone as abstract attributes
+    Added serializeable and clone as class attributes that concrete subclasses must set
 """
 
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import ClassVar, Union
 # from code_validator import CodeValidator  #circular import
 # from ..routines.checkdigit.checkdigit_exception import CheckDigitException
 from .checkdigit_exception import CheckDigitException
@@ -64,28 +64,24 @@ class CheckDigit(ABC):
         serializable (bool): Indicates if the object is serializable.
         clone (bool): Indicates if the object can be cloned.
     """
-    # Forces subclasses to define this attribute
-    @property
-    @abstractmethod
-    def serializable(self) -> bool:
-        """
-        Indicates if this check digit implementation supports serialization.
+    # Concrete subclasses must define these as class attributes (enforced in `__init_subclass__`).
+    serializable: ClassVar[bool]
+    clone: ClassVar[bool]
 
-        Returns:
-            bool: True if serializable; False otherwise.
-        """
-        pass
-    
-    @property
-    @abstractmethod
-    def clone(self) -> bool:
+    def __init_subclass__(cls, **kwargs):
         """
-        Indicates if this check digit implementation supports cloning.
+        Ensures concrete subclasses declare the `serializable` and `clone` class attributes.
 
-        Returns:
-            bool: True if cloneable; False otherwise.
+        Raises:
+            TypeError: If a subclass implementing `calculate()` and `is_valid()` does not set them.
         """
-        pass
+        super().__init_subclass__(**kwargs)
+        # Abstract intermediate classes may leave these to their own subclasses.
+        if any(getattr(getattr(cls, name), "__isabstractmethod__", False) for name in ("calculate", "is_valid")):
+            return
+        for name in ("serializable", "clone"):
+            if not hasattr(cls, name):
+                raise TypeError(f"{cls.__name__} must set {name}")
 
     @abstractmethod
     def calculate(self, code: str) -> Union[str, CheckDigitException, None]:
@@ -50,8 +50,8 @@ class EAN13CheckDigit(ModulusCheckDigit):
     """
     # EAN13_CHECK_DIGIT should be public, but to make implementing singletons easier, I've made it private.
     __EAN13_CHECK_DIGIT:EAN13CheckDigit = None
-    # POSITION_WEIGHT (list[int]): Weighting given to digits depending on their right position
-    __POSITION_WEIGHT:Final[list] = [3, 1]
+    # POSITION_WEIGHT (bytes): Weighting given to digits depending on their right position
+    __POSITION_WEIGHT:Final[bytes] = bytes((3, 1))
 
     def __init__(self):
         """Constructs a Check Digit routine for EAN-13."""
@@ -39,7 +39,7 @@ class ISINCheckDigit(ModulusCheckDigit):
     """
 
     _MAX_ALPHANUMERIC_VALUE: Final[int] = 35
-    _POSITION_WEIGHT: Final[list[int]] = [2, 1]
+    _POSITION_WEIGHT: Final[bytes] = bytes((2, 1))
     _ISIN_CHECK_DIGIT: Final["ISINCheckDigit"] = None  # Set after class definition
 
     def __init__(self) -> None:
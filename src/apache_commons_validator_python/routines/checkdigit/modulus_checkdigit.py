@@ -47,6 +47,9 @@ class ModulusCheckDigit(AbstractCheckDigit):
     It supports single-digit numeric codes like EAN-13. For alphanumeric codes (e.g., EAN-128)
     override the `_to_int()` and `_to_char()` methods.
 
+    Subclasses that weight digits from a fixed table should store it as a `bytes` constant
+    (e.g. `bytes((3, 1))`) rather than a `list`, which keeps the table compact and immutable.
+
     Attributes:
         MODULUS_10 (int):
         MODULUS_11 (int):
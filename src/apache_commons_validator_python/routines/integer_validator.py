@@ -23,9 +23,15 @@ License (Taken from apache.commons.validator.routines.IntegerValidator.java):
     limitations under the License.
 """
 
-from typing import Final, override
+from functools import lru_cache
+from typing import Final, Iterable, override
 from ..routines.abstract_number_validator import AbstractNumberValidator
 
+_INT_MIN: Final[int] = -2**31
+_INT_MAX: Final[int] = 2**31 - 1
+# The number of digits in `_INT_MAX` (and in `_INT_MIN`, without its sign).
+_INT_MAX_DIGITS: Final[int] = len(str(_INT_MAX))
+
 class IntegerValidator(AbstractNumberValidator):
     """Integer Validation and Conversion routines.
 
@@ -51,11 +57,10 @@ class IntegerValidator(AbstractNumberValidator):
         INT_MAX (int): The maximum value of an int (2^31 - 1).
     """
 
-    _VALIDATOR = None
-    INT_MIN:   Final[int] = -2**31
-    INT_MAX:   Final[int] = 2**31 - 1
+    INT_MIN:   Final[int] = _INT_MIN
+    INT_MAX:   Final[int] = _INT_MAX
 
-    def __init__(self, strict: bool=True, format_type: int=0):
+    def __init__(self, strict: bool=True, format_type: int=0, use_parse_cache: bool=False):
         """Construct an instance with the specified strict setting and format type or a
         strict instance by default.
 
@@ -68,8 +73,13 @@ class IntegerValidator(AbstractNumberValidator):
             strict (bool): `True` if strict parsing should be used, default is `True`.
             format_type (int): The format type to create for validation,
                 default is `STANDARD_FORMAT`.
+            use_parse_cache (bool): `True` if the results of `validate()` should be memoized
+                for repeated inputs, default is `False`.
         """
         super().__init__(strict, format_type, False)
+        # Per-instance, so entries are never shared between validators. The cache and the validator
+        # reference each other, so both are reclaimed together by the cycle collector.
+        self.__cached_parse = lru_cache(maxsize=4096)(self._parse) if use_parse_cache else None
 
     @classmethod
     def get_instance(cls):
@@ -78,9 +88,7 @@ class IntegerValidator(AbstractNumberValidator):
         Returns:
             A singleton instance of the validator.
         """
-        if cls._VALIDATOR is None:
-            cls._VALIDATOR = IntegerValidator()
-        return cls._VALIDATOR
+        return _VALIDATOR
     
     @override
     def _process_parsed_value(self, value: str, formatter):
@@ -96,7 +104,7 @@ class IntegerValidator(AbstractNumberValidator):
         """
         try:
             val = int(formatter(value))
-            if self.is_in_range(val, self.INT_MIN, self.INT_MAX):
+            if _INT_MIN <= val <= _INT_MAX:
                 return val
         except ValueError:
             return None
@@ -113,9 +121,44 @@ class IntegerValidator(AbstractNumberValidator):
         Returns:
             The parsed int if valid or `None` if invalid.
         """
-        val = self._parse(value, pattern, locale)
-        
-        if val is None:
-            return val
-        
-        return val
+        # Fast path: plain ASCII digits in the default format need no locale handling.
+        if pattern is None and locale is None and value is not None:
+            digits = value.strip()
+            negative = digits[:1] == '-'
+            unsigned = digits[1:] if negative else digits
+            if unsigned.isascii() and unsigned.isdigit():
+                # Only the significant digits go to `int()`, which refuses strings beyond its digit limit;
+                # more of them than `_INT_MAX` has can't be in range.
+                significant = unsigned.lstrip('0')
+                if len(significant) > _INT_MAX_DIGITS:
+                    return None
+                val = int(significant or '0')
+                if negative:
+                    val = -val
+                return val if _INT_MIN <= val <= _INT_MAX else None
+
+        if (self.__cached_parse is not None and isinstance(value, str)
+                and (pattern is None or isinstance(pattern, str)) and (locale is None or isinstance(locale, str))):
+            return self.__cached_parse(value, pattern, locale)
+        return self._parse(value, pattern, locale)
+
+    def validate_batch(self, values: Iterable[str], pattern: str=None, locale=None) -> list:
+        """Validate/convert a sequence of integers using the same optional pattern and/or
+        locale for every value.
+
+        Args:
+            values (Iterable[str]): The values validation is being performed on.
+            pattern (str): The (optional) regex pattern used to validate the values against,
+                or the default for the locale if `None`.
+            locale (str): The (optional) locale to use for the format, defaults to the system default.
+
+        Returns:
+            A list holding the parsed int for each valid value and `None` for each invalid value,
+            in the same order as `values`.
+        """
+        validate = self.validate
+        return [validate(value, pattern, locale) for value in values]
+
+
+# The singleton instance of this IntegerValidator.
+_VALIDATOR: Final[IntegerValidator] = IntegerValidator()
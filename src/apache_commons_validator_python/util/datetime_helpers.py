@@ -39,10 +39,12 @@ from babel.dates import (
     get_time_format
 )
 from dateparser import parse
-from datetime import date, datetime, tzinfo
+from dateparser.date import DateDataParser
+from datetime import date, datetime, timezone as dt_timezone, tzinfo
+from functools import lru_cache
 import locale
 import re
-from typing import Union
+from typing import Optional, Union
 from tzlocal import get_localzone_name
 from zoneinfo import ZoneInfo
 
@@ -70,6 +72,48 @@ locale_to_dateparser_locale = {
 }
 
 
+# Java→Python token mappings used by `ldml_to_strptime_format()`.
+_JAVA2PY:dict[str, str] = {
+    'yyyy': '%Y',
+    'yy':   '%y',
+    'MMMM': '%B',
+    'MMM':  '%b',
+    'MM':   '%m',
+    'M':    '%m',
+    'dd':   '%d',
+    'd':    '%d',
+    'EEEE': '%A',
+    'EEE':  '%a',
+    'HH':   '%H',
+    'H':    '%H',
+    'hh':   '%I',
+    'h':    '%I',
+    'mm':   '%M',
+    'm':    '%M',
+    'ss':   '%S',
+    's':    '%S',
+    'SSS':  '%f',   # Java ms → Python μs; we'll truncate later if needed
+    'a':    '%p',
+    'z':    '%Z',     # General timezone (e.g. PST)
+    'Z':    '%z',   # RFC 822 time zone (e.g. -0800)
+    'XXX':  '%:z',  # Python 3.7+ supports “+HH:MM”
+    'XX':   '%z',
+    'X':    '%z',
+}
+# Regex matching any of the Java tokens, longest tokens first.
+_JAVA_TOKEN_RE:re.Pattern = re.compile('|'.join(re.escape(tok) for tok in sorted(_JAVA2PY, key=len, reverse=True)))
+# Regex matching the tokens of a babel pattern format string, e.g. '%(M)s'.
+_FLEXIBLE_TOKEN_RE:re.Pattern = re.compile(r'%\((?P<tok>.*?)\)s')
+# Reference datetimes (mid-winter and mid-summer) used by `timezone_has_same_rules()`.
+_REF_WINTER:datetime = datetime(2024, 1, 15, 12)
+_REF_SUMMER:datetime = datetime(2024, 7, 15, 12)
+# The same reference instants in UTC, used by `_dst_free_tzname()`.
+_REF_WINTER_UTC:datetime = _REF_WINTER.replace(tzinfo=ZoneInfo("UTC"))
+_REF_SUMMER_UTC:datetime = _REF_SUMMER.replace(tzinfo=ZoneInfo("UTC"))
+# The Unix epoch, used by `date_get_time()`.
+_EPOCH_UTC:datetime = datetime(1970, 1, 1, tzinfo=ZoneInfo("UTC"))
+
+
 # ----------------------------- Helper Functions -------------------------------:
 
 # --------------- Utility Functions ---------------:
@@ -99,10 +143,14 @@ def obj_to_str(expected_obj:object, tested_obj:object=None) -> str:
     return f"Assert failed; \n {str_expect} \n {str_test}"
 
 
+@lru_cache(maxsize=1)
 def get_default_locale() -> str:
     """
     Retrieve the system's default locale code.
 
+    The locale is looked up once and memoized; call ``get_default_locale.cache_clear()``
+    after changing the process locale.
+
     Returns:
         str: Locale code (e.g., 'en_US').
     """
@@ -111,10 +159,14 @@ def get_default_locale() -> str:
 
 
 
+@lru_cache(maxsize=1)
 def get_default_tzinfo() -> tzinfo:
     """
     Retrieve the system's default timezone as a tzinfo object.
 
+    The timezone is looked up once and memoized; call ``get_default_tzinfo.cache_clear()``
+    after changing the system timezone.
+
     Returns:
         tzinfo: System local timezone.
     """
@@ -136,25 +188,56 @@ def get_tzname(timezone:tzinfo) -> str:
     Returns:
         str: tzinfo object's name (e.g., 'PST').
     """
-    dt:datetime = datetime.now().astimezone(tz=timezone)
-    return dt.tzname()
+    if isinstance(timezone, dt_timezone):
+        # Fixed offset; not memoized, as `timezone` instances that differ only in name compare equal.
+        return timezone.tzname(None)
+    try:
+        hash(timezone)
+    except TypeError:
+        # Unhashable tzinfo implementations (e.g. dateutil's) can't be memoized.
+        name = None
+    else:
+        name = _dst_free_tzname(timezone)
+    if name is None:
+        # The name depends on whether daylight saving time is currently in effect.
+        name = datetime.now(timezone).tzname()
+    return name
+
+
+@lru_cache(maxsize=64)
+def _dst_free_tzname(timezone:tzinfo) -> str:
+    """
+    Memoized name of a timezone whose name is the same in winter and summer.
+
+    Returns:
+        str or None: The timezone's name, or None if it differs between winter and summer.
+    """
+    # Convert rather than `replace()`: pytz zones attached with `replace()` report their LMT offset.
+    winter_name = _REF_WINTER_UTC.astimezone(timezone).tzname()
+    summer_name = _REF_SUMMER_UTC.astimezone(timezone).tzname()
+    return winter_name if winter_name == summer_name else None
 
   
-def date_get_time(dt:datetime) -> float:
+def date_get_time(dt:datetime) -> int:
     """
     Return milliseconds since Unix epoch (January 1, 1970, 00:00:00 GMT) for a datetime.
     
-    Python wrapper for Java's ``Date.getTime()`` function.
+    Python wrapper for Java's ``Date.getTime()`` function. Naive datetimes are taken to be
+    in the system's local time, as with ``datetime.timestamp()``.
     
     Args:
         dt (datetime): Input datetime.
 
     Returns:
-        float: Milliseconds since 1970-01-01T00:00:00Z.
+        int: Milliseconds since 1970-01-01T00:00:00Z (sub-millisecond precision is dropped).
     """
-    return dt.timestamp() * 1000
+    if dt.tzinfo is None or dt.utcoffset() is None:
+        dt = dt.astimezone()
+    delta = dt - _EPOCH_UTC
+    return delta.days * 86400000 + delta.seconds * 1000 + delta.microseconds // 1000
 
 
+@lru_cache(maxsize=64)
 def timezone_gmt(zone:str) -> ZoneInfo:
     """
     Create a tzinfo object for a given timezone name.
@@ -202,65 +285,50 @@ def timezone_has_same_rules(val1: Union[datetime, tzinfo], val2: Union[datetime,
     if tz1 is None or tz2 is None:
         return False
 
-    # Use a reference datetime for comparison.
-    ref = datetime.now()
-    offset1 = tz1.utcoffset(ref)
-    offset2 = tz2.utcoffset(ref)
-
-    return offset1 == offset2
+    # Compare the offsets in winter and summer, so both the raw offset and DST are checked.
+    return (tz1.utcoffset(_REF_WINTER) == tz2.utcoffset(_REF_WINTER)
+            and tz1.utcoffset(_REF_SUMMER) == tz2.utcoffset(_REF_SUMMER))
 
 
 
 # ------------ Parsing Functions ---------------:
+@lru_cache(maxsize=128)
 def ldml_to_strptime_format(java_input:str) -> str:
     """
     Convert Java SimpleDateFormat patterns to patterns accepted by Python's ``strptime()``.
 
+    Results are memoized, so each pattern is only converted once across validation calls.
+
     Args:
         java_fmt (str): Java date/time format string (ldml format).
 
     Returns:
         str: Equivalent Python strftime format.
     """
-    # Define Java→Python token mappings.
-    java2py = {
-        'yyyy': '%Y',
-        'yy':   '%y',
-        'MMMM': '%B',
-        'MMM':  '%b',
-        'MM':   '%m',
-        'M':    '%m',
-        'dd':   '%d',
-        'd':    '%d',
-        'EEEE': '%A',
-        'EEE':  '%a',
-        'HH':   '%H',
-        'H':    '%H',
-        'hh':   '%I',
-        'h':    '%I',
-        'mm':   '%M',
-        'm':    '%M',
-        'ss':   '%S',
-        's':    '%S',
-        'SSS':  '%f',   # Java ms → Python μs; we'll truncate later if needed
-        'a':    '%p',
-        'z':    '%Z',     # General timezone (e.g. PST)
-        'Z':    '%z',   # RFC 822 time zone (e.g. -0800)
-        'XXX':  '%:z',  # Python 3.7+ supports “+HH:MM”
-        'XX':   '%z',
-        'X':    '%z',
-    }
-
-    # Build a regex that matches any of the Java tokens.
-    combined = '|'.join(re.escape(tok) for tok in sorted(java2py, key=len, reverse=True))
-    pattern = re.compile(combined)
-
-    def replace(match):
-        java_token = match.group(0)
-        return java2py[java_token]
-
-    # Every time the regex finds a Java token, it calls replace() to get the Python equivalent.
-    return pattern.sub(repl=replace, string=java_input)
+    # Every time the regex finds a Java token, look up the Python equivalent.
+    return _JAVA_TOKEN_RE.sub(lambda match: _JAVA2PY[match.group(0)], java_input)
+
+
+@lru_cache(maxsize=32)
+def _date_data_parser(*, locales:tuple=None, languages:tuple=None, region:str=None, settings_key:tuple=None) -> DateDataParser:
+    """
+    Memoized ``DateDataParser`` for a locale/language/region configuration, so dateparser's
+    locale loading is done once per configuration rather than on every `fuzzy_parse()` call.
+
+    `settings_key` is the dateparser settings dict frozen into a sorted tuple of items.
+    """
+    return DateDataParser(
+        locales=list(locales) if locales else None,
+        languages=list(languages) if languages else None,
+        region=region,
+        settings=dict(settings_key) if settings_key else None
+    )
+
+
+def _get_date_obj(parser:DateDataParser, value:str, date_formats:list=None) -> datetime:
+    """Parse `value` with `parser`, returning the datetime as ``dateparser.parse()`` would."""
+    data = parser.get_date_data(value, date_formats)
+    return data["date_obj"] if data else None
 
 
 def fuzzy_parse(*, value:str, pattern:str, locale:str, settings:dict) -> datetime:
@@ -282,23 +350,36 @@ def fuzzy_parse(*, value:str, pattern:str, locale:str, settings:dict) -> datetim
     Returns:
         datetime or None: Parsed datetime or None if all attempts fail.
     """
+    settings_key = tuple(sorted(settings.items())) if settings else None
     date_parser_locale = locale_to_dateparser_locale.get(locale, locale)
-    dt = parse(date_string=value, date_formats=[pattern], locales=[date_parser_locale], settings=settings)
+    dt = _get_date_obj(_date_data_parser(locales=(date_parser_locale,), settings_key=settings_key), value, [pattern])
     if dt is None:
         if "_" in locale:
             lang, country = locale.split("_")
-            dt = parse(value, date_formats = [pattern], languages = [lang], settings=settings)
+            dt = _get_date_obj(_date_data_parser(languages=(lang,), settings_key=settings_key), value, [pattern])
             if dt is None:
-                dt = parse(value, date_formats = [pattern], region=country, settings=settings)
+                dt = _get_date_obj(_date_data_parser(region=country, settings_key=settings_key), value, [pattern])
         else:
             # Try language only
-            dt = parse(value, languages = [date_parser_locale], settings=settings)
+            dt = _get_date_obj(_date_data_parser(languages=(date_parser_locale,), settings_key=settings_key), value)
             if dt is None:
                 # Try country only
-                dt = parse(value, region = date_parser_locale, settings=settings)
+                dt = _get_date_obj(_date_data_parser(region=date_parser_locale, settings_key=settings_key), value)
     return dt
 
 
+@lru_cache(maxsize=64)
+def _time_pattern(style_format:str, locale:str) -> str:
+    """Memoized LDML pattern of babel's `style_format` time format for `locale`."""
+    return get_time_format(format=style_format, locale=locale).pattern
+
+
+@lru_cache(maxsize=64)
+def _date_pattern(style_format:str, locale:str) -> str:
+    """Memoized LDML pattern of babel's `style_format` date format for `locale`."""
+    return get_date_format(format=style_format, locale=locale).pattern
+
+
 def ldml2strptime(value:str, style_format:str = 'short', locale:str = None) -> datetime:
     """
     Parse a time string into datetime using Babel's LDML style formats.
@@ -317,7 +398,7 @@ def ldml2strptime(value:str, style_format:str = 'short', locale:str = None) -> d
     
     try:
         # Strict parsing using strptime()
-        ldml_pattern = get_time_format(format=style_format, locale=locale).pattern
+        ldml_pattern = _time_pattern(style_format, locale)
         return parse_pattern_strict(value, ldml_pattern)
     
     except Exception as e:
@@ -341,7 +422,7 @@ def ldml2strpdate(value:str, style_format:str = 'short', locale:str = None) -> d
         locale = get_default_locale()
 
     try:
-        ldml_pattern = get_date_format(format=style_format, locale=locale).pattern
+        ldml_pattern = _date_pattern(style_format, locale)
         if style_format == 'short':
             # Flexible parsing using regex
             return parse_pattern_flexible(value, ldml_pattern)
@@ -368,54 +449,108 @@ def parse_pattern_strict(value:str, ldml_pattern:str) -> datetime:
     return datetime.strptime(value, pat)
 
 
-def parse_pattern_flexible(value:str, ldml_pattern:str) -> datetime:
+@lru_cache(maxsize=128)
+def _compile_flexible(ldml_pattern:str) -> tuple[re.Pattern, str, tuple]:
     """
-    Flexibly parse a date string mimicking Java's flexible locale-dependent 'short' style.
+    Build (once per pattern) the anchored regex and the scanner operations used by
+    `parse_pattern_flexible()`.
 
-    There are multiple acceptable "short" strings per locale in Java's SimpleDateFormat, 
-    but only one acceptable "short" string per locale in Python. 
-    
     Args:
-        value (str): Date string to parse.
-        ldml_pattern (str): LDML 'short' pattern to guide parsing.
+        ldml_pattern (str): LDML 'short' pattern to build the regex from.
 
     Returns:
-        datetime or None: Parsed datetime or None if unparseable.
+        tuple: The compiled regex with `day`, `month`, and `year` groups, the literal prefix
+        of the pattern, and a tuple of ``(group, literal)`` pairs: each numeric field in order,
+        followed by the literal text after it.
+
+    Raises:
+        ValueError: If the pattern contains a token other than day, month, or year.
     """
     pat = parse_pattern(ldml_pattern).format  # e.g. '%(M)s/%(d)s/%(yy)s'
 
-    # 2. Build regex from tokens
-    token_re = re.compile(r'%\((?P<tok>.*?)\)s')
+    # Build regex from tokens
     parts = []
+    fields = []
+    literals = []
     last = 0
-    for m in token_re.finditer(pat):
+    for m in _FLEXIBLE_TOKEN_RE.finditer(pat):
         # literal part
-        lit = re.escape(pat[last:m.start()])
-        parts.append(lit)
+        literals.append(pat[last:m.start()])
+        parts.append(re.escape(literals[-1]))
         # token part
         tok = m.group('tok')
         if tok.startswith('d'):        # d, dd, ddd… → day
-            parts.append(r'(?P<day>\d+)')
+            fields.append('day')
         elif tok.startswith('M'):      # M, MM, MMM… → month
-            parts.append(r'(?P<month>\d+)')
+            fields.append('month')
         elif tok.startswith('y'):      # y, yy, yyyy… → year
-            parts.append(r'(?P<year>\d+)')
+            fields.append('year')
         else:
             raise ValueError(f"Unsupported token: {tok}")
+        parts.append(rf'(?P<{fields[-1]}>\d+)')
         last = m.end()
-    parts.append(re.escape(pat[last:]))
-    regex = '^' + ''.join(parts) + '$'
+    literals.append(pat[last:])
+    parts.append(re.escape(literals[-1]))
+    regex = re.compile('^' + ''.join(parts) + '$')
+    return regex, literals[0], tuple(zip(fields, literals[1:]))
 
-    # 3. Match and extract
-    m = re.match(regex, value)
-    if not m:
-        print(f"Unparseable date: {value!r} for pattern {ldml_pattern!r}")
+
+def _scan_flexible(value:str, prefix:str, ops:tuple) -> Optional[dict[str, str]]:
+    """
+    Match `value` against the operations built by `_compile_flexible()` without the regex engine.
+
+    Each numeric field greedily consumes a run of decimal digits, as the regex's ``\\d+`` does,
+    so a successful scan yields the same groups as the regex.
+
+    Returns:
+        dict or None: The digit strings keyed by group name, or None if the scan failed
+        (the value may still match the regex, which backtracks).
+    """
+    if not value.startswith(prefix):
         return None
+    i = len(prefix)
+    end = len(value)
+    groups = {}
+    for group, literal in ops:
+        j = i
+        while j < end and value[j].isdecimal():
+            j += 1
+        if j == i or not value.startswith(literal, j):
+            return None
+        groups[group] = value[i:j]
+        i = j + len(literal)
+    return groups if i == end else None
+
+
+def parse_pattern_flexible(value:str, ldml_pattern:str) -> datetime:
+    """
+    Flexibly parse a date string mimicking Java's flexible locale-dependent 'short' style.
+
+    There are multiple acceptable "short" strings per locale in Java's SimpleDateFormat, 
+    but only one acceptable "short" string per locale in Python. 
+    
+    Args:
+        value (str): Date string to parse.
+        ldml_pattern (str): LDML 'short' pattern to guide parsing.
+
+    Returns:
+        datetime or None: Parsed datetime or None if unparseable.
+    """
+    # 2. Build (or reuse) the regex and scanner operations for this pattern
+    regex, prefix, ops = _compile_flexible(ldml_pattern)
+
+    # 3. Match and extract, scanning directly first and falling back to the regex
+    groups = _scan_flexible(value, prefix, ops)
+    if groups is None:
+        m = regex.match(value)
+        if not m:
+            return None
+        groups = m.groupdict()
 
     # 4. Convert fields
-    month = int(m.group('month'))
-    day   = int(m.group('day'))
-    ystr  = m.group('year')
+    month = int(groups['month'])
+    day   = int(groups['day'])
+    ystr  = groups['year']
     # Pivot two‐digit years
     if len(ystr) == 2 and ystr.isdigit():
         now = date.today()
@@ -1,4 +1,3 @@
-import xml.sax
 import xml.etree.ElementTree as ET
 from typing import Any, Dict, Optional, Type
 from ..form_set_new import FormSet
@@ -10,13 +9,14 @@ from ..arg_new import Arg
 from ..form_set_factory_new import FormSetFactory
 from ..validator_action_new import ValidatorAction
 
-class Digester(xml.sax.ContentHandler):
-    """Custom SAX-based XML parser that interprets digester rule files and applies them 
+class Digester:
+    """Custom XML parser that interprets digester rule files and applies them 
     to dynamically construct and wire objects such as FormSet, Form, Field, etc., 
     based on the XML structure.
 
-    This class mimics Apache Commons Digester by using SAX parsing combined with 
-    pattern-based rule interpretation, creating a hierarchy of validation resources.
+    This class mimics Apache Commons Digester by using SAX-style start/end element
+    callbacks combined with pattern-based rule interpretation, creating a hierarchy of
+    validation resources. The callbacks are driven by ``xml.etree.ElementTree.iterparse``.
     """
     
     def __init__(self, root_object: ['ValidatorResources']):
@@ -26,8 +26,6 @@ class Digester(xml.sax.ContentHandler):
             root_object (ValidatorResources): The root object (usually ValidatorResources) 
                 to which created objects will be attached.
         """
-        super().__init__()
-
         self.rules: Dict[str, Dict[str, Any]] = {}
         #: Mapping from XML element path strings to associated digester rule configurations.
 
@@ -117,15 +115,15 @@ class Digester(xml.sax.ContentHandler):
 
         load_patterns(root)
 
-    def startElement(self, name: str, attrs: xml.sax.xmlreader.AttributesImpl) -> None:
-        """Handles logic for start of an XML element during SAX parsing.
+    def startElement(self, name: str, attrs: Dict[str, str]) -> None:
+        """Handles logic for start of an XML element during parsing.
 
         Applies any factory-create-rule or object-create-rule for the current path,
         sets properties, and pushes the created object onto the object stack.
 
         Args:
             name (str): Name of the XML tag.
-            attrs (AttributesImpl): Attributes associated with the tag.
+            attrs (Dict[str, str]): Attributes associated with the tag.
         """
         
         self.current_path.append(name)
@@ -159,7 +157,7 @@ class Digester(xml.sax.ContentHandler):
 
 
     def endElement(self, name: str) -> None:
-        """Handles logic for end of an XML element during SAX parsing.
+        """Handles logic for end of an XML element during parsing.
 
         Applies call-method-rule if present and wires the current object to its parent
         via set-next-rule. Also processes call-param-rule for nested values.
@@ -209,12 +207,19 @@ class Digester(xml.sax.ContentHandler):
         """Parses the input XML file using this digester instance.
 
         Args:
-            xml_file (str): Path to the XML file to parse.
+            xml_file (str): Path to the XML file to parse, or a file-like object.
 
         Returns:
             Any: The root object with attached parsed structure (usually ValidatorResources).
         """
-        parser = xml.sax.make_parser()
-        parser.setContentHandler(self)
-        parser.parse(xml_file)
+        for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+            if event == "start":
+                self.startElement(elem.tag, elem.attrib)
+            else:
+                # The buffer is reset at every start and end tag, so by now it would only
+                # hold the text after the last child (or all of the text, if childless).
+                text = elem[-1].tail if len(elem) else elem.text
+                if text:
+                    self.characters(text)
+                self.endElement(elem.tag)
         return self.object_stack[0] if self.object_stack else None
\ No newline at end of file
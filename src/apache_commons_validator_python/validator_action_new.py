@@ -1,5 +1,5 @@
 import importlib
-from typing import List, Optional
+from typing import Callable, ClassVar, Dict, List, Optional
 
 class ValidatorAction:
     """ Contains the information to dynamically create and run a validation method. 
@@ -7,17 +7,25 @@ class ValidatorAction:
     an xml file with the <validator> element.
     """
 
+    __slots__ = (
+        'name', 'class_name', 'method', 'depends', '__js_function', '__validator_class', '__bound_method',
+        '__depends_source', '__depends_parsed'
+    )
+
+    _CLASS_CACHE: ClassVar[Dict[str, object]] = {}
+    #: Loaded classes/modules keyed by their full class name, shared by all actions.
+
     def __init__(self):
-        self.__name: Optional[str] = None
+        self.name: Optional[str] = None
         #: The name of the validation.
 
-        self.__class_name: Optional[str] = None
+        self.class_name: Optional[str] = None
         #: The full class name of the class containing the validation method associated with this action.
 
-        self.__method: Optional[str] = None
+        self.method: Optional[str] = None
         #: The full method name of the validation to be performed.
 
-        self.__depends: Optional[str] = None
+        self.depends: Optional[str] = None
         #: The other `ValidatorAction`s` that this one depends on. If any errors occur in an action that this one depends on, this action will not be processed.
 
         self.__js_function: Optional[str] = None
@@ -26,64 +34,16 @@ class ValidatorAction:
         self.__validator_class: Optional[object] = None  
         #: Loaded class/module
 
-    # ------------ Setters / Getters ------------
-
-    @property
-    def name(self) -> str:
-        """Returns the name fo the validation.
-        
-        Returns: 
-            name (str)
-        """
-        return self.__name
+        self.__bound_method: Optional[Callable] = None
+        #: The validation method, bound to a shared validator instance on first execution.
 
-    @name.setter
-    def name(self, value):
-        """Sets the name of the validation."""
-        self.__name = value
+        self.__depends_source: Optional[str] = None
+        #: The `depends` string last parsed by `get_dependencies()`.
 
-    @property
-    def class_name(self) -> str:
-        """Returns the class name of the class containing
-        the validation method.
+        self.__depends_parsed: tuple = ()
+        #: The dependency names parsed from `__depends_source`.
 
-        Returns:
-            class_name (str)
-        """
-        return self.__class_name
-
-    @class_name.setter
-    def class_name(self, value):
-        """Sets the class name."""
-        self.__class_name = value
-
-    @property
-    def method(self) -> str:
-        """Returns the method name.
-
-        Returns:
-            method_name (str)
-        """
-        return self.__method
-
-    @method.setter
-    def method(self, value):
-        """Sets the method name."""
-        self.__method = value
-
-    @property
-    def depends(self) -> str:
-        """Gets the other `ValidatorAction`s` that this one depends on. 
-
-        Returns:
-            depends (str)
-        """
-        return self.__depends
-
-    @depends.setter
-    def depends(self, value):
-        """Sets the other `ValidatorAction`s` that this one depends on. """
-        self.__depends = value
+    # ------------ Setters / Getters ------------
 
     def setJavascript(self, js_function) -> Optional[str]:
         """Sets the  field to contain the name to be used if JavaScript is generated.
@@ -101,15 +61,20 @@ class ValidatorAction:
 
     def init(self):
         """Dynamically load the validator class/module."""
-        if not self.__class_name:
+        if not self.class_name:
             raise ValueError("class_name must be set before init()")
 
-        try:
-            module_name, class_name = self.__class_name.rsplit(".", 1)
-            module = importlib.import_module(module_name)
-            self.__validator_class = getattr(module, class_name)
-        except: 
-            raise Exception(f"{self.__class_name} can't be imported. ")
+        validator_class = ValidatorAction._CLASS_CACHE.get(self.class_name)
+        if validator_class is None:
+            try:
+                module_name, class_name = self.class_name.rsplit(".", 1)
+                module = importlib.import_module(module_name)
+                validator_class = getattr(module, class_name)
+            except: 
+                raise Exception(f"{self.class_name} can't be imported. ")
+            ValidatorAction._CLASS_CACHE[self.class_name] = validator_class
+        self.__validator_class = validator_class
+        self.__bound_method = None
 
     # ------------ Execution ------------
 
@@ -123,26 +88,31 @@ class ValidatorAction:
         Returns:
             Result of the validation (e.g., True/False).
         """
-        if self.__validator_class is None:
-            raise Exception("Validator class not initialized. Call init() first.")
-
-        instance = (
-            self.__validator_class() if callable(self.__validator_class) else self.__validator_class
-        )
-
-        method = getattr(instance, self.__method)
+        method = self.__bound_method
+        if method is None:
+            if self.__validator_class is None:
+                raise Exception("Validator class not initialized. Call init() first.")
+
+            # Validators are stateless, so one instance serves every execution.
+            instance = (
+                self.__validator_class() if callable(self.__validator_class) else self.__validator_class
+            )
+            method = self.__bound_method = getattr(instance, self.method)
         return method(validator, params)
 
     # ------------ Dependency Parsing ------------
 
     def get_dependencies(self) -> List[str]:
         """Returns dependencies as a list."""
-        if self.__depends:
-            return [dep.strip() for dep in self.__depends.split(",")]
-        return []
+        depends = self.depends
+        if depends is not self.__depends_source:
+            # `depends` was reassigned since it was last parsed.
+            self.__depends_parsed = tuple(dep.strip() for dep in depends.split(",")) if depends else ()
+            self.__depends_source = depends
+        return list(self.__depends_parsed)
 
     def __str__(self):
         return (
-            f"ValidatorAction(name={self.__name}, class_name={self.__class_name}, "
-            f"method={self.__method}, depends={self.__depends})"
+            f"ValidatorAction(name={self.name}, class_name={self.class_name}, "
+            f"method={self.method}, depends={self.depends})"
         )
\ No newline at end of file
@@ -1,4 +1,8 @@
-from typing import Any, Dict, Optional
+import sys
+from typing import Any, Dict, Final, Optional, Tuple
+
+# Page bound used when no page is set, so fields on every page are validated.
+_ALL_PAGES: float = float("inf")
 
 
 class Validator:
@@ -8,8 +12,8 @@ class Validator:
     Equivalent to org.apache.commons.validator.Validator in the Java version.
     """
 
-    VALIDATOR_RESULTS_PARAM: str = "ValidatorResults"
-    FIELD_PARAM: str = "field"
+    VALIDATOR_RESULTS_PARAM: Final[str] = "ValidatorResults"
+    FIELD_PARAM: Final[str] = "field"
 
     def __init__(
         self,
@@ -20,7 +24,8 @@ class Validator:
         self._resources = resources
         #: The Validator Resources
 
-        self._form_key = form_key
+        self._form_key = sys.intern(form_key) if type(form_key) is str else form_key
+        #: The name of the form to validate, interned to match the `FormSet` keys
 
         self._params = parameters or {}
         #: Maps validation method parameter class names to the objects to be passed into the method.
@@ -34,8 +39,8 @@ class Validator:
         self._form: Optional["Form"] = None
         #: The form to validate
 
-        self._locale: Optional[Dict[str, str]] = None  
-        #: Dict with keys: language, country, variant
+        self._locale: Tuple[Optional[str], Optional[str], Optional[str]] = ("en", "US", None)
+        #: The (language, country, variant) the form is looked up with
 
     def set_only_return_errors(self, only_errors: bool) -> None:
         """Sets only_return_errors
@@ -87,32 +92,36 @@ class Validator:
         Returns:
             ValidatorResults
         """
-        if self._form is None:
-            self._form = self._resolve_form()
-
-        # from ..validator_exception_new import ValidatorException
-        from .validator_exception_new import ValidatorException
-        if self._form is None:
-            raise ValidatorException(f"Form '{self._form_key}' not found.")
+        form = self._form
+        if form is None:
+            form = self._resolve_form()
 
-        page = self._page if self._page is not None else float("inf")
+        page = self._page if self._page is not None else _ALL_PAGES
 
-        return self._form.validate(
+        return form.validate(
             self._params,
             self._resources.get_validator_actions(),
             page
         )
 
-    def _resolve_form(self) -> Optional["Form"]:
-        if self._locale:
-            return self._resources.get_form(
-                self._locale.get("language"),
-                self._locale.get("country"),
-                self._locale.get("variant"),
-                self._form_key
-            )
-        else:
-            return self._resources.get_form("en", "US", None, self._form_key)
+    def _resolve_form(self) -> "Form":
+        """Looks up the form for the current locale and caches it until the locale
+        changes.
+
+        Raises:
+            ValidatorException: if the form is not found.
+
+        Returns:
+            Form
+        """
+        language, country, variant = self._locale
+        form = self._resources.get_form(language, country, variant, self._form_key)
+        if form is None:
+            # from ..validator_exception_new import ValidatorException
+            from .validator_exception_new import ValidatorException
+            raise ValidatorException(f"Form '{self._form_key}' not found.")
+        self._form = form
+        return form
 
     def set_locale(self, language: str, country: str = None, variant: str = None):
         """Set the locale of the validator.
@@ -122,7 +131,8 @@ class Validator:
             country (str, optional). Defaults to None.
             variant (str, optional). Defaults to None.
         """
-        self._locale = {"language": language, "country": country, "variant": variant}
+        self._locale = (language, country, variant)
+        self._form = None
 
     def validate_field(self, field_name: str) -> "ValidatorResults":
         """Validate the field in the form.
@@ -136,18 +146,13 @@ class Validator:
         Returns:
             ValidatorResults
         """
-        if self._form is None:
-            self._form = self._resolve_form()
-
-        # from ..validator_exception_new import ValidatorException
-        from .validator_exception_new import ValidatorException
-        
-        if self._form is None:
-            raise ValidatorException(f"Form '{self._form_key}' not found.")
+        form = self._form
+        if form is None:
+            form = self._resolve_form()
 
-        page = self._page if self._page is not None else float("inf")
+        page = self._page if self._page is not None else _ALL_PAGES
 
-        return self._form.validate(
+        return form.validate(
             self._params,
             self._resources.get_validator_actions(),
             page,
@@ -17,9 +17,12 @@ from __future__ import annotations
 import logging
 from urllib.request import urlopen
 import locale
-from typing import IO, Any, Dict, List, Optional, Final, Union
+from typing import IO, Any, Dict, List, Mapping, Optional, Final, Union
 import os
+import sys
 import importlib
+from types import MappingProxyType
+from functools import lru_cache
 from io import StringIO
 class ValidatorResources:
     """General purpose class for storing FormSet objects based on their associated
@@ -73,19 +76,25 @@ class ValidatorResources:
     ]
     
 
-    __REGISTRATIONS: Final[Dict[str, str]] = {
-        "-//Apache Software Foundation//DTD Commons Validator Rules Configuration 1.0//EN": "/org/apache/commons/validator/resources/validator_1_0.dtd",
-        "-//Apache Software Foundation//DTD Commons Validator Rules Configuration 1.0.1//EN": "/org/apache/commons/validator/resources/validator_1_0_1.dtd",
-        "-//Apache Software Foundation//DTD Commons Validator Rules Configuration 1.1//EN": "/org/apache/commons/validator/resources/validator_1_1.dtd",
-        "-//Apache Software Foundation//DTD Commons Validator Rules Configuration 1.1.3//EN": "/org/apache/commons/validator/resources/validator_1_1_3.dtd",
-        "-//Apache Software Foundation//DTD Commons Validator Rules Configuration 1.2.0//EN": "/org/apache/commons/validator/resources/validator_1_2_0.dtd",
-        "-//Apache Software Foundation//DTD Commons Validator Rules Configuration 1.3.0//EN": "/org/apache/commons/validator/resources/validator_1_3_0.dtd",
-        "-//Apache Software Foundation//DTD Commons Validator Rules Configuration 1.4.0//EN": "/org/apache/commons/validator/resources/validator_1_4_0.dtd",
-    }  #: Mapping of DTD public identifiers to resource paths.
-
-    _DEFAULT_LOCALE: str = (
-        locale.getlocale()[0] or "en_US"
-    )  #: Default locale based on system settings.
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _registrations() -> Dict[str, str]:
+        """Mapping of DTD public identifiers to resource paths, built on first use."""
+        return {
+            "-//Apache Software Foundation//DTD Commons Validator Rules Configuration 1.0//EN": "/org/apache/commons/validator/resources/validator_1_0.dtd",
+            "-//Apache Software Foundation//DTD Commons Validator Rules Configuration 1.0.1//EN": "/org/apache/commons/validator/resources/validator_1_0_1.dtd",
+            "-//Apache Software Foundation//DTD Commons Validator Rules Configuration 1.1//EN": "/org/apache/commons/validator/resources/validator_1_1.dtd",
+            "-//Apache Software Foundation//DTD Commons Validator Rules Configuration 1.1.3//EN": "/org/apache/commons/validator/resources/validator_1_1_3.dtd",
+            "-//Apache Software Foundation//DTD Commons Validator Rules Configuration 1.2.0//EN": "/org/apache/commons/validator/resources/validator_1_2_0.dtd",
+            "-//Apache Software Foundation//DTD Commons Validator Rules Configuration 1.3.0//EN": "/org/apache/commons/validator/resources/validator_1_3_0.dtd",
+            "-//Apache Software Foundation//DTD Commons Validator Rules Configuration 1.4.0//EN": "/org/apache/commons/validator/resources/validator_1_4_0.dtd",
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _default_locale() -> str:
+        """Default locale based on system settings, looked up on first use."""
+        return locale.getlocale()[0] or "en_US"
 
     serializable = True 
     #: Is the class serializable
@@ -115,9 +124,18 @@ class ValidatorResources:
         self._h_actions: Dict[str, 'ValidatorAction'] = {}
         #: All `ValidatorAction`s stored in this object. 
 
+        self._actions_view: Mapping[str, 'ValidatorAction'] = MappingProxyType(self._h_actions)
+        #: Read-only view of `_h_actions` handed out by `get_validator_actions()`.
+
         self._default_form_set: Optional['FormSet'] = None
         #: Default `FormSet`
 
+        self._locale_key_cache: Dict[tuple, str] = {}
+        #: Locale keys built by `build_locale()`, keyed on their (lang, country, variant) parts.
+
+        self._form_resolve_cache: Dict[tuple, 'Form'] = {}
+        #: Forms resolved by `get_form()`, keyed on (language, country, variant, form_key).
+
         if sources:
             if not isinstance(sources, list):
                 sources = [sources]
@@ -168,7 +186,7 @@ class ValidatorResources:
             name (str): name of the global constant
             value (str): value of the global constant
         """
-        self.__logger.debug(f"Adding Global Constant: {name}, {value}")
+        self.__logger.debug("Adding Global Constant: %s, %s", name, value)
         self._h_constants[name] = value
 
     def add_form_set(self, form_set: 'FormSet') -> None:
@@ -184,12 +202,13 @@ class ValidatorResources:
             self._default_form_set = form_set
         else:
             if self._h_form_sets == None:
-                self.__logger.debug(f"Adding FormSet '{form_set}'.")
+                self.__logger.debug("Adding FormSet '%s'.", form_set)
             else:
                 self.__logger.debug(
-                    f"Overriding FormSet definition. Duplicate for locale {key}."
+                    "Overriding FormSet definition. Duplicate for locale %s.", key
                 )
             self._h_form_sets[key] = form_set
+        self._form_resolve_cache.clear()
 
     def get_form(self, *args) -> "Form":
         """Gets a Form based on either on language, country, variant and formkey or
@@ -219,46 +238,38 @@ class ValidatorResources:
         Returns:
             form with locale or None.
         """
-        form = None
-
-        # Try language/country/variant
-        key = self.build_locale(language, country, variant)
-        if key is not None and key in self._h_form_sets:
-            form_set = self._h_form_sets[key]
+        cache_key = (language, country, variant, form_key)
+        form = self._form_resolve_cache.get(cache_key)
+        if form is not None:
+            return form
+
+        # Try language/country/variant, then language/country, then language
+        build_locale = self.build_locale
+        locale_key: Final[str] = build_locale(language, country, variant)
+        form_sets = self._h_form_sets
+        for key in (
+            locale_key,
+            build_locale(language, country, None),
+            build_locale(language, None, None),
+        ):
+            form_set = form_sets.get(key)
             if form_set is not None:
                 form = form_set.get_form(form_key)
-        locale_key: Final[str] = key
-
-        # Try language/country
-        if form is None:
-            key = self.build_locale(language, country, None)
-            if key is not None and key in self._h_form_sets:
-                form_set: Final['FormSet'] = self._h_form_sets[key]
-                if form_set is not None:
-                    form = form_set.get_form(form_key)
-
-        # Try language
-        if form is None:
-            key = self.build_locale(language, None, None)
-            if key is not None and key in self._h_form_sets:
-                form_set: Final['FormSet'] = self._h_form_sets[key]
-                if form_set is None:
-                    form = form_set.get_form(form_key)
+                if form is not None:
+                    break
 
         # Try default formset
-        if form is None:
-            try:
-                form = self._default_form_set.get_form(form_key)
-                key = "default"
-            except:
-                pass
+        if form is None and self._default_form_set is not None:
+            form = self._default_form_set.get_form(form_key)
+            key = "default"
 
         if form is None:
-            self.__logger.debug(f"Form '{form_key}' is not found for locale '{locale_key}'.")
+            self.__logger.debug("Form '%s' is not found for locale '%s'.", form_key, locale_key)
         else:
             self.__logger.debug(
-                f"Form '{form_key}' found in formset '{key}' for locale '{locale_key}'"
+                "Form '%s' found in formset '%s' for locale '%s'", form_key, key, locale_key
             )
+            self._form_resolve_cache[cache_key] = form
 
         return form
 
@@ -298,7 +309,18 @@ class ValidatorResources:
         Returns:
             str
         """
-        return "_".join(filter(None, [lang, country, variant]))
+        parts = (lang, country, variant)
+        key = self._locale_key_cache.get(parts)
+        if key is None:
+            if not variant:
+                if not country:
+                    key = lang or ""
+                else:
+                    key = f"{lang}_{country}" if lang else country
+            else:
+                key = "_".join([part for part in parts if part])
+            key = self._locale_key_cache[parts] = sys.intern(key)
+        return key
 
     def add_validator_action(self, validator_action: 'ValidatorAction') -> None:
         """Add a ValidatorAction to the resource.
@@ -309,7 +331,7 @@ class ValidatorResources:
         validator_action.init()
         self._h_actions[validator_action.name] = validator_action
         self.__logger.debug(
-            f"Add ValidatorAction: {validator_action.name},{validator_action.class_name}"
+            "Add ValidatorAction: %s,%s", validator_action.name, validator_action.class_name
         )
 
     def get_validator_action(self, key: str) -> Optional['ValidatorAction']:
@@ -320,13 +342,14 @@ class ValidatorResources:
         """
         return self._h_actions.get(key)
 
-    def get_validator_actions(self) -> Dict[str, 'ValidatorAction']:
-        """Returns a copy of the ValidatorActions in this resources."""
-        return dict(self._h_actions)  # Return a copy to prevent modification
+    def get_validator_actions(self) -> Mapping[str, 'ValidatorAction']:
+        """Returns a read-only view of the ValidatorActions in this resources."""
+        return self._actions_view
 
     def process(self):
         """Processes the ValidatorResources object."""
         self.__logger.debug("Processing ValidatorResources")
+        self._form_resolve_cache.clear()
         if self._default_form_set:
             self._default_form_set.process(self._h_constants)
         for form_set in self._h_form_sets.values():
@@ -1,4 +1,4 @@
-from typing import Final, Iterator
+from typing import Final, Tuple
 from types import MappingProxyType
 
 class ValidatorResult:
@@ -17,6 +17,8 @@ class ValidatorResult:
 
         cloneable = False
         #: is the class cloneable
+
+        __slots__ = ('_valid', '_result')
         
         def __init__(self, valid: bool, result: object = None):
             self._valid: bool = valid
@@ -55,7 +57,16 @@ class ValidatorResult:
         #: the Field being validated
 
         self._h_actions = {}
-        #: the map of actions
+        #: the map of actions, to (valid, result) tuples
+
+        self._action_statuses = {}
+        #: the map of actions to ResultStatus objects, refreshed on demand
+
+        self._action_map = MappingProxyType(self._action_statuses)
+        #: read-only view of `_action_statuses`
+
+        self._stale_actions = {}
+        #: the actions added since `_action_statuses` was last refreshed, in insertion order
     
     @property
     def field(self):
@@ -70,7 +81,8 @@ class ValidatorResult:
             result (bool): Whether the validation passed.
             value (object, optional): Value returned by the validator.
         """
-        self._h_actions[validator_name] = ValidatorResult.ResultStatus(result, value)
+        self._h_actions[validator_name] = (result, value)
+        self._stale_actions[validator_name] = None
 
     def contains_action(self, validator_name: str) -> bool:
         """Indicates whether a specified validator is in the result.
@@ -83,13 +95,13 @@ class ValidatorResult:
         """
         return validator_name in self._h_actions
 
-    def get_actions(self) -> Iterator[str]:
-        """Gets an iterator of the action names contained in this result.
+    def get_actions(self) -> Tuple[str, ...]:
+        """Gets the action names contained in this result.
 
         Returns:
-            Iterator[str]: An iterator over the validator action names.
+            Tuple[str, ...]: The validator action names, in the order they were added.
         """
-        return iter(self._h_actions.keys())
+        return tuple(self._h_actions)
 
     def get_action_map(self) -> MappingProxyType:
         """Gets an unmodifiable mapping of validator actions.
@@ -97,7 +109,13 @@ class ValidatorResult:
         Returns:
             MappingProxyType: A read-only dictionary mapping validator names to ResultStatus objects.
         """
-        return MappingProxyType(self._h_actions)
+        if self._stale_actions:
+            # Refresh only the added actions, in place, so every view handed out sees the new statuses.
+            h_actions = self._h_actions
+            for name in self._stale_actions:
+                self._action_statuses[name] = ValidatorResult.ResultStatus(*h_actions[name])
+            self._stale_actions.clear()
+        return self._action_map
 
     def get_result(self, validator_name: str):
         """Gets the result of a validation.
@@ -108,8 +126,8 @@ class ValidatorResult:
         Returns:
             object: The result returned by the validator, or None if not found.
         """
-        status: Final[ValidatorResult.ResultStatus] = self._h_actions.get(validator_name)
-        return None if status is None else status.result
+        status: Final[tuple] = self._h_actions.get(validator_name)
+        return None if status is None else status[1]
 
     def is_valid(self, validator_name: str) -> bool:
         """Indicates whether a specified validation passed.
@@ -120,5 +138,5 @@ class ValidatorResult:
         Returns:
             bool: True if the validation passed; False otherwise.
         """
-        status: Final[ValidatorResult.ResultStatus] = self._h_actions.get(validator_name)
-        return status is not None and status.valid
\ No newline at end of file
+        status: Final[tuple] = self._h_actions.get(validator_name)
+        return status is not None and status[0]
\ No newline at end of file
@@ -42,7 +42,7 @@ from src.apache_commons_validator_python.util.datetime_helpers import (
     obj_to_str, 
     get_default_tzinfo
 )
-from src.apache_commons_validator_python.routines.abstract_calendar_validator import AbstractCalendarValidator
+from src.apache_commons_validator_python.routines.abstract_calendar_validator import AbstractCalendarValidator, _matches_pattern
 from src.apache_commons_validator_python.routines.calendar_validator import CalendarValidator
 from src.test.routines.test_abstract_calendar_validator import TestAbstractCalendarValidator
 from src.test.util.test_timezones import TestTimeZones
@@ -117,6 +117,9 @@ class TestCalendarValidator(TestAbstractCalendarValidator):
         assert ZoneInfo("Etc/GMT") == cal_utc.tzinfo, "SAME: Check GMT(B)"
         assert TestTimeZones.UTC != cal_utc.tzinfo, "SAME: Check UTC(B)"
 
+        # Adjust to the identical tzinfo
+        assert CalendarValidator.adjust_to_time_zone(cal_utc, cal_utc.tzinfo) is cal_utc, "IDENTICAL: Check unchanged"
+
     # Prepare variables for the tests of validation Methods.
     @pytest.fixture
     def expected_dt(self) -> datetime:
@@ -179,6 +182,47 @@ class TestCalendarValidator(TestAbstractCalendarValidator):
             assert output_dt is None, assert_msg
 
     
+    def test_validate_specialized(self) -> None:
+        """Test the specialized `validate_*()` methods match `CalendarValidator.validate()`."""
+        validator = CalendarValidator.get_instance()
+        assert validator.validate(self.defaultVal) == validator.validate_default(self.defaultVal), "validate_default"
+        assert validator.validate(self.patternVal, self.pattern) == validator.validate_pattern(self.patternVal, self.pattern), "validate_pattern"
+        assert validator.validate(self.localeValShort, locale=self.locale) == validator.validate_locale(self.localeValShort, self.locale), "validate_locale"
+        assert validator.validate(self.germanVal, self.germanPattern, JavaToPyLocale.GERMAN) == validator.validate_full(self.germanVal, self.germanPattern, JavaToPyLocale.GERMAN), "validate_full"
+        assert validator.validate_default(self.xxxx) is None, "validate_default invalid"
+        assert validator.validate_pattern(self.xxxx, self.pattern) is None, "validate_pattern invalid"
+
+
+    @pytest.mark.parametrize (
+        "input_val, assert_msg", [
+            (patternVal, "validate(D) iso valid"),
+            ("2005-02-30", "validate(D) iso invalid day"),
+            ("2005-13-01", "validate(D) iso invalid month"),
+            ("2005-12-31T00:00", "validate(D) iso with time"),
+        ]
+    )
+    def test_validate_iso_pattern(self, input_val:str, assert_msg:str) -> None:
+        """Test the ISO-8601 fast path of `CalendarValidator.validate()` against the general parser."""
+        validator = CalendarValidator()
+        expected = validator._parse(input_val, self.pattern, None, None)
+        assert expected == validator.validate(value=input_val, pattern=self.pattern), assert_msg
+
+
+    def test_validate_pattern_with_offset(self) -> None:
+        """Test a UTC offset parsed by the pattern is converted to the timezone, not overwritten."""
+        output_dt = self.cal_validator.validate("2024-01-01 10:00 +0500", "yyyy-MM-dd HH:mm Z", JavaToPyLocale.US, TestTimeZones.UTC)
+        assert output_dt == datetime(2024, 1, 1, 5, 0, tzinfo=TestTimeZones.UTC)
+        assert output_dt.utcoffset() == TestTimeZones.UTC.utcoffset(None)
+
+
+    def test_validate_pattern_with_zone_name(self) -> None:
+        """Test a zone name parsed by the pattern is converted to the timezone, not overwritten."""
+        tokyo = ZoneInfo("Asia/Tokyo")
+        output_dt = self.cal_validator.validate("2024-01-01 10:00 UTC", "yyyy-MM-dd HH:mm z", JavaToPyLocale.US, tokyo)
+        assert output_dt == datetime(2024, 1, 1, 19, 0, tzinfo=tokyo)
+        assert output_dt.utcoffset() == tokyo.utcoffset(output_dt)
+
+
     @pytest.mark.parametrize (
         "input_val, input_pattern, input_locale, assert_msg", [
             (defaultVal, None, default_locale,  "validate(C) default"),
@@ -238,6 +282,13 @@ class TestCalendarValidator(TestAbstractCalendarValidator):
         assert assert_type == CalendarValidator.get_instance().is_valid(value=input_val, pattern=input_pattern, locale=input_locale), assert_msg
    
     
+    def test_is_valid_batch(self) -> None:
+        """ Test `CalendarValidator.is_valid_batch()` matches `is_valid()` for each value."""
+        values = [self.patternVal, self.xxxx, None, self.patternVal]
+        assert self.cal_validator.is_valid_batch(values, pattern=self.pattern) == [True, False, False, True]
+        assert self.cal_validator.is_valid_batch([], pattern=self.pattern) == []
+
+   
     def test_compare(self) -> None:
         """ Test compare date methods. """
         same_time = 124522
@@ -310,12 +361,28 @@ class TestCalendarValidator(TestAbstractCalendarValidator):
         assert 1 == self.cal_validator.compare_quarters(value, cal20050701, 2), "qtrB =3"    # same quarter
         assert 1 == self.cal_validator.compare_quarters(value, cal20050731, 2), "qtrB =4"    # -1 month
         assert 1 == self.cal_validator.compare_quarters(value, cal20050630, 2), "qtrB GT"    # -1 quarter
+        # First month of the quarter
+        cal20050115 = TestAbstractCalendarValidator._create_calendar(ZoneInfo("Etc/GMT"), 20050115, same_time)
+        cal20050215 = TestAbstractCalendarValidator._create_calendar(ZoneInfo("Etc/GMT"), 20050215, same_time)
+        assert 0 == self.cal_validator.compare_quarters(cal20050115, cal20050215), "qtrC =1"    # same quarter
+        assert -1 == self.cal_validator.compare_quarters(cal20050115, cal20050215, 2), "qtrC LT"    # +1 quarter (Feb)
+        assert (2005, 1) == CalendarValidator.quarter_key(cal20050215, 2), "qtrC key"
        
         # Compare Years
         assert -1 == self.cal_validator.compare_years(value, cal20060101), "year LT"    # +1 year
         assert 0 == self.cal_validator.compare_years(value, cal20050101), "year EQ"    # same year
         assert 1 == self.cal_validator.compare_years(value, cal20041231), "year GT"    # -1 year
 
+        # Cross-year comparisons: `_compare()` compares the year first, like the public methods.   # Added test cases
+        cal20231215 = TestAbstractCalendarValidator._create_calendar(ZoneInfo("Etc/GMT"), 20231215, same_time)
+        cal20240115 = TestAbstractCalendarValidator._create_calendar(ZoneInfo("Etc/GMT"), 20240115, same_time)
+        for field, compare_method in [("month", self.cal_validator.compare_months), ("day", self.cal_validator.compare_dates)]:
+            assert -1 == compare_method(cal20231215, cal20240115), f"{field} LT, but year LT"
+            assert -1 == self.cal_validator._compare(cal20231215, cal20240115, field), f"{field}(B) LT, but year LT"
+            assert 1 == compare_method(cal20240115, cal20231215), f"{field} GT, but year GT"
+            assert 1 == self.cal_validator._compare(cal20240115, cal20231215, field), f"{field}(B) GT, but year GT"
+        assert -1 == self.cal_validator._compare(cal20231215, cal20240115, "hour"), "hour(B) LT, but year LT"
+
         # invalid compare
         with pytest.raises(TypeError) as e:
             self.cal_validator._compare(value, value, -1)
@@ -333,6 +400,17 @@ class TestCalendarValidator(TestAbstractCalendarValidator):
         assert dt_validator.is_valid(value=us_val, locale=JavaToPyLocale.US), "validate(A) locale."
 
 
+    def test_date_time_style_is_valid_pattern(self) -> None:
+        """Test patterns strptime() can't answer for (zone names, locale text) fall through to `_parse()`."""
+        dt_validator = AbstractCalendarValidator(True, 3, 3)
+        assert _matches_pattern("2024-01-01 10:00", "yyyy-MM-dd HH:mm")
+        assert not _matches_pattern("2024-01-01 10:00 UTC", "yyyy-MM-dd HH:mm z")
+        assert not _matches_pattern("01 Jan 2024 10:00", "dd MMM yyyy HH:mm")
+        assert dt_validator.is_valid(value="2024-01-01 10:00 UTC", pattern="yyyy-MM-dd HH:mm z")
+        assert not dt_validator.is_valid(value="2024-01-01 10:00 XYZ", pattern="yyyy-MM-dd HH:mm z")
+        assert dt_validator.is_valid(value="01 Jan 2024 10:00", pattern="dd MMM yyyy HH:mm")
+
+
     @pytest.fixture
     def cal20051231(self):
         return self._create_calendar(zone=ZoneInfo("Etc/GMT"), date=20051231, time=11500) 
@@ -118,3 +118,24 @@ class TestIntegerValidator(TestAbstractNumberValidator):
         assert self._validator.is_valid("2147483648") is False
         assert self._validator.is_valid("-2147483648") is True
         assert self._validator.is_valid("-2147483649") is False
+
+    def test_validate_ascii_digits(self):
+        assert self._strict_validator.validate("1234") == self._test_number
+        assert self._strict_validator.validate(" -1234 ") == -self._test_number
+        assert self._strict_validator.validate(self.INT_MAX) == self.INT_MAX_VAL
+        assert self._strict_validator.validate(self.INT_MIN) == self.INT_MIN_VAL
+        assert self._strict_validator.validate(self.INT_MAX_1) is None
+        assert self._strict_validator.validate(self.INT_MIN_1) is None
+        assert self._strict_validator.validate("1" * 5000) is None
+        assert self._strict_validator.validate("-" + "1" * 5000) is None
+        assert self._strict_validator.validate("0" * 5000 + "1234") == self._test_number
+
+    def test_validate_batch(self):
+        values = ["1234", " -1234 ", "X", None, self.INT_MAX_1]
+        assert self._strict_validator.validate_batch(values) == [self._test_number, -self._test_number, None, None, None]
+        assert self._strict_validator.validate_batch([]) == []
+
+    def test_validate_parse_cache(self):
+        cached = IntegerValidator(use_parse_cache=True)
+        for value in [self._test_string_us, self._test_string_us, "X", "1.2"]:
+            assert cached.validate(value) == self._strict_validator.validate(value)
@@ -0,0 +1,67 @@
+import locale
+
+import pytest
+
+# GenericTypeValidator converts to NumPy types.
+np = pytest.importorskip("numpy")
+
+from src.apache_commons_validator_python.generic_type_validator_new import GenericTypeValidator
+
+
+@pytest.fixture(autouse=True)
+def restore_locale():
+    """The *_locale formatters set the process locale; put it back after each test."""
+    saved = locale.setlocale(locale.LC_ALL)
+    yield
+    locale.setlocale(locale.LC_ALL, saved)
+
+
+def test_format_int_locale():
+    assert GenericTypeValidator.format_int_locale("1234", "C") == 1234
+    assert isinstance(GenericTypeValidator.format_int_locale("1234", "C"), np.int32)
+    assert GenericTypeValidator.format_int_locale("12a", "C") is None
+    assert GenericTypeValidator.format_int_locale(None, "C") is None
+
+def test_format_long_and_short_locale():
+    assert GenericTypeValidator.format_long_locale("-1234", "C") == -1234
+    assert GenericTypeValidator.format_short_locale("1234", "C") == 1234
+    assert GenericTypeValidator.format_short_locale("xx", "C") is None
+
+def test_format_float_and_double_locale():
+    assert GenericTypeValidator.format_float_locale("12.5", "C") == 12.5
+    assert GenericTypeValidator.format_double_locale("12.5", "C") == 12.5
+    assert GenericTypeValidator.format_double_locale("abc", "C") is None
+
+def test_format_byte_locale():
+    assert GenericTypeValidator.format_byte_locale("12", "C") == 12
+    assert GenericTypeValidator.format_byte_locale("abc", "C") is None
+
+def test_format_locale_unknown_locale():
+    """An unknown locale is reported as a failed conversion, not raised."""
+    assert GenericTypeValidator.format_int_locale("1234", "xx_NOT_A_LOCALE") is None
+    assert GenericTypeValidator.format_float_locale("12.5", "xx_NOT_A_LOCALE") is None
+    assert GenericTypeValidator.format_date("01/31/24", "xx_NOT_A_LOCALE") is None
+
+def test_format_date_locale():
+    assert GenericTypeValidator.format_date("01/31/24", "C").date().isoformat() == "2024-01-31"
+    assert GenericTypeValidator.format_date("31/01/24", "C") is None
+
+def test_format_int():
+    assert GenericTypeValidator.format_int("1234") == 1234
+    assert GenericTypeValidator.format_int(" -1234 ") == -1234
+    assert GenericTypeValidator.format_int("1_000") == 1000
+    assert GenericTypeValidator.format_int("12a") is None
+    assert GenericTypeValidator.format_int("") is None
+    assert GenericTypeValidator.format_int(None) is None
+
+def test_format_byte():
+    assert GenericTypeValidator.format_byte("12") == 12
+    assert isinstance(GenericTypeValidator.format_byte("12"), np.int8)
+    assert GenericTypeValidator.format_byte("1.5") is None
+    assert GenericTypeValidator.format_byte(None) is None
+
+def test_format_int_and_byte_non_str():
+    """Non-string values skip the string pre-filter and go straight to the conversion."""
+    assert GenericTypeValidator.format_int(12) == 12
+    assert GenericTypeValidator.format_int(np.int64(5)) == 5
+    assert GenericTypeValidator.format_byte(12) == 12
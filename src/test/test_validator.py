@@ -89,3 +89,27 @@ def test_validate_field_not_found():
     with pytest.raises(ValidatorException) as excinfo:
         validator.validate_field("fake_field")
     assert "fake_field" in str(excinfo.value)
+
+
+def test_set_locale_resets_resolved_form():
+    resources = build_resources_with_field()
+
+    validator = Validator(resources, "profileForm", {"email": "test@example.com"})
+    validator.set_locale("en")
+    validator.get_result()
+    assert validator.get_form() is not None
+
+    validator.set_locale("fr")
+    assert validator.get_form() is None
+
+
+def test_get_result_follows_field_page_change():
+    resources = build_resources_with_field(page=2)  # Field is on page 2
+
+    validator = Validator(resources, "profileForm", {"email": "test@example.com"})
+    validator.set_locale("en")
+    validator.set_page(0)
+    assert validator.get_result().get_validator_result("email") is None  # Should be skipped
+
+    validator.get_form().get_field("email").page = 0  # Move the field onto page 0
+    assert validator.get_result().get_validator_result("email").is_valid("always")
@@ -57,6 +57,30 @@ def test_validator_action_execute(monkeypatch):
     result = action.execute_validation_method(None, {"field_value": ""})
     assert result is False
 
+def test_validator_action_init_cached(monkeypatch):
+    """Test init() imports each class name only once."""
+
+    import types
+
+    imports = []
+
+    def mock_import_module(name):
+        imports.append(name)
+        module = types.SimpleNamespace()
+        module.MockValidator = MockValidator
+        return module
+
+    monkeypatch.setattr("importlib.import_module", mock_import_module)
+
+    for _ in range(3):
+        action = ValidatorAction()
+        action.class_name = "cached.module.MockValidator"
+        action.method = "validate"
+        action.init()
+        assert action._ValidatorAction__validator_class == MockValidator
+
+    assert imports == ["cached.module"]
+
 def test_validator_action_dependencies():
     """Test dependency parsing."""
     action = ValidatorAction()
@@ -64,6 +88,17 @@ def test_validator_action_dependencies():
     deps = action.get_dependencies()
     assert deps == ["required", "email", "minLength"]
 
+def test_validator_action_dependencies_reassigned():
+    """Test dependency parsing follows reassignment of depends."""
+    action = ValidatorAction()
+    assert action.get_dependencies() == []
+    action.depends = "required, email"
+    assert action.get_dependencies() == ["required", "email"]
+    action.get_dependencies().append("mutated")
+    assert action.get_dependencies() == ["required", "email"]
+    action.depends = "minLength"
+    assert action.get_dependencies() == ["minLength"]
+
 def test_validator_action_set_js_function():
     """Test setting and getting JS function."""
     action = ValidatorAction()
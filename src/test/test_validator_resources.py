@@ -67,8 +67,25 @@ def test_get_form_locale_priority_mock():
     assert resources._get_form_with_locale("en", "US", "variant", "f") == "form_v"
     assert resources._get_form_with_locale("en", "US", None, "f") == "form_c"
     assert resources._get_form_with_locale("en", None, "x", "f") == "form_l"
+    assert resources._get_form_with_locale("en", "GB", "x", "f") == "form_l"
     assert resources._get_form_with_locale(None, None, None, "f") == "form_d"
 
+def test_get_form_cache_invalidated_mock():
+    resources = ValidatorResources()
+
+    fs_old = MagicMock(); fs_old.get_form.return_value = "form_old"
+    fs_old.language, fs_old.country, fs_old.variant = "en", "US", None
+    fs_new = MagicMock(); fs_new.get_form.return_value = "form_new"
+    fs_new.language, fs_new.country, fs_new.variant = "en", "US", None
+
+    resources.add_form_set(fs_old)
+    assert resources.get_form("en", "US", None, "f") == "form_old"
+    assert resources.get_form("en", "US", None, "f") == "form_old"
+    assert fs_old.get_form.call_count == 1
+
+    resources.add_form_set(fs_new)
+    assert resources.get_form("en", "US", None, "f") == "form_new"
+
 # ============================== Real Unit Tests ============================= #
 
 def test_initialize_with_stream(valid_xml):
@@ -40,4 +40,42 @@ def test_get_action_map_immutable():
 
     assert "required" in action_map
     with pytest.raises(TypeError):
-        action_map["new"] = "fail"  # Should raise because MappingProxyType is immutable
\ No newline at end of file
+        action_map["new"] = "fail"  # Should raise because MappingProxyType is immutable
+
+def test_get_action_map_status():
+    result = ValidatorResult(field="testField")
+    result.add("required", True, "ok")
+    status = result.get_action_map()["required"]
+
+    assert isinstance(status, ValidatorResult.ResultStatus)
+    assert status.valid is True
+    assert status.result == "ok"
+
+    result.add("email", False, "bad")
+    action_map = result.get_action_map()
+    assert action_map["email"].valid is False
+    assert action_map["email"].result == "bad"
+
+def test_get_action_map_same_view():
+    result = ValidatorResult(field="testField")
+    result.add("required", True)
+    action_map = result.get_action_map()
+
+    result.add("email", False)
+    assert result.get_action_map() is action_map
+    assert action_map["email"].valid is False
+
+def test_get_action_map_refreshes_added_actions_only():
+    result = ValidatorResult(field="testField")
+    result.add("required", True)
+    required_status = result.get_action_map()["required"]
+
+    result.add("email", False)
+    action_map = result.get_action_map()
+    assert action_map["required"] is required_status
+    assert list(action_map) == ["required", "email"]
+
+    result.add("required", False, "changed")
+    assert result.get_action_map() is action_map
+    assert action_map["required"].valid is False
+    assert action_map["required"].result == "changed"
@@ -0,0 +1,54 @@
+"""
+Module Name: test_datetime_helpers.py
+Description:
+    To run:
+        - Go to: apache-commons-validator-python/src/
+        - In the terminal, type: pytest
+    This file contains:
+        - Additional test cases for util/datetime_helpers.py (no Java equivalent).
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from src.apache_commons_validator_python.util.datetime_helpers import date_get_time, get_tzname
+
+
+@pytest.mark.parametrize("zone_name", ["Asia/Kolkata", "America/New_York", "UTC"])
+def test_get_tzname_zoneinfo(zone_name:str) -> None:
+    """Test `get_tzname()` matches the zone's current name for zoneinfo timezones."""
+    zone = ZoneInfo(zone_name)
+    assert get_tzname(zone) == datetime.now(zone).tzname()
+
+
+@pytest.mark.parametrize("zone_name", ["Asia/Kolkata", "America/New_York", "UTC"])
+def test_get_tzname_pytz(zone_name:str) -> None:
+    """Test `get_tzname()` reports the zone's abbreviation, not its LMT name, for pytz timezones."""
+    pytz = pytest.importorskip("pytz")
+    zone = pytz.timezone(zone_name)
+    assert get_tzname(zone) == datetime.now(zone).tzname()
+    assert get_tzname(zone) != "LMT"
+
+
+def test_get_tzname_fixed_offset() -> None:
+    """Test `get_tzname()` keeps the names of fixed-offset timezones that compare equal apart."""
+    assert get_tzname(timezone(timedelta(hours=1))) == "UTC+01:00"
+    assert get_tzname(timezone(timedelta(hours=1), "CET")) == "CET"
+    assert get_tzname(timezone.utc) == "UTC"
+
+
+def test_date_get_time() -> None:
+    """Test `date_get_time()` returns whole milliseconds since the epoch as an int, like Java's ``Date.getTime()``."""
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    assert date_get_time(epoch) == 0
+    assert isinstance(date_get_time(epoch), int)
+    # Sub-millisecond precision is dropped (floored), before and after the epoch.
+    assert date_get_time(epoch + timedelta(microseconds=1999)) == 1
+    assert date_get_time(epoch - timedelta(microseconds=1)) == -1
+    # The offset is taken into account.
+    assert date_get_time(datetime(1970, 1, 1, 1, tzinfo=timezone(timedelta(hours=1)))) == 0
+    assert date_get_time(datetime(2024, 1, 1, tzinfo=ZoneInfo("UTC"))) == 1704067200000
+    # Naive datetimes are in local time, as with `datetime.timestamp()`.
+    naive = datetime(2024, 1, 1, 12, 30)
+    assert date_get_time(naive) == int(naive.timestamp()) * 1000
@@ -154,4 +154,97 @@ def test_digester_validator_actions(digester):
     assert "required" in resources._get_actions()
     action = resources._get_actions()["required"]
     assert action.name == "required"
-    assert action.class_name == "src.test.util.test_digester.RequiredValidator"
\ No newline at end of file
+    assert action.class_name == "src.test.util.test_digester.RequiredValidator"
+class SaxDigesterHandler(xml.sax.ContentHandler):
+    """Drives a Digester's callbacks with xml.sax, as Digester.parse() used to."""
+
+    def __init__(self, digester):
+        super().__init__()
+        self.digester = digester
+
+    def startElement(self, name, attrs):
+        self.digester.startElement(name, attrs)
+
+    def endElement(self, name):
+        self.digester.endElement(name)
+
+    def characters(self, content):
+        self.digester.characters(content)
+
+def snapshot(resources):
+    """Summarize the constants, validator actions, form sets, forms, and fields parsed into `resources`."""
+    form_sets = {}
+    for form_set_key, form_set in resources._get_form_sets().items():
+        form_sets[form_set_key] = {
+            form_name: [
+                (
+                    field.field_property,
+                    field.depends,
+                    field.page,
+                    sorted((var.name, var.value, var.js_type) for var in field.vars.values()),
+                    sorted((msg.name, msg.key) for msg in field.msgs.values()),
+                )
+                for field in form.fields
+            ]
+            for form_name, form in form_set.get_forms().items()
+        }
+    actions = {name: (action.class_name, action.method) for name, action in resources._get_actions().items()}
+    return dict(resources._get_constants()), actions, form_sets
+
+def test_digester_parse_matches_sax(digester):
+    """Digester.parse() builds the same objects as driving the digester with xml.sax, including for
+    padded, whitespace-only, mixed, and nested text content."""
+    validation_xml = """<?xml version="1.0"?>
+        <form-validation>
+            <constant>
+                <constant-name>  padded  </constant-name>
+                <constant-value>
+                    5
+                </constant-value>
+            </constant>
+            <constant>
+                <constant-name>mixed<!-- a comment -->Name</constant-name>
+                <constant-value><![CDATA[a<b]]> &amp; c</constant-value>
+            </constant>
+            <constant>
+                <constant-name>nested</constant-name>
+                <constant-value>before<ignored>inner</ignored>after</constant-value>
+            </constant>
+            <constant>
+                <constant-name>blank</constant-name>
+                <constant-value>   </constant-value>
+            </constant>
+            <validator name="required" classname="src.test.util.test_digester.RequiredValidator" method="validate">
+                <javascript>
+                    function required() {}
+                </javascript>
+            </validator>
+            <formset language="en" country="US">
+                <form name="userForm">
+                    <field field_property="username" depends="required" page="1">
+                        <var name="maxLength" value="50" js_type="int"/>
+                        <msg name="required" key="username.required"/>
+                    </field>
+                    text between fields
+                    <field field_property="email" depends="required,email"/>
+                </form>
+            </formset>
+        </form-validation>
+    """
+    digester, resources = digester
+    digester.parse(io.StringIO(validation_xml))
+
+    sax_resources = ValidatorResources()
+    sax_digester = Digester(root_object=sax_resources)
+    sax_digester.load_rules("src/apache_commons_validator_python/digester-rules.xml")
+    xml.sax.parseString(validation_xml.encode(), SaxDigesterHandler(sax_digester))
+
+    assert snapshot(resources) == snapshot(sax_resources)
+    constants = resources._get_constants()
+    assert constants["padded"] == "5"
+    assert constants["mixedName"] == "a<b & c"
+    assert constants["nested"] == "after"
+    assert "blank" not in constants
+    form = next(iter(resources._get_form_sets().values())).get_forms()["userForm"]
+    assert [field.field_property for field in form.fields] == ["username", "email"]
+    assert form.fields[0].vars["maxLength"].value == "50"